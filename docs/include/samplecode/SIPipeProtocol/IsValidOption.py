@@ -8,3 +8,6 @@ SIAuto.Si.Connections = "pipe()"
 
 # log messages to SI Console using pipe name "sipipe", with asyncronous send enabled.
 SIAuto.Si.Connections = "pipe(pipename=sipipe,reconnect=true,reconnect.interval=10s,async.enabled=true)"
+
+# log messages to SI Console using pipe name "sipipe", writing packets to the pipe in 32KB batches.
+SIAuto.Si.Connections = "pipe(pipename=sipipe,buffer=32KB)"
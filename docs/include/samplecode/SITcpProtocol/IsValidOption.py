@@ -11,3 +11,6 @@ SIAuto.Si.Connections = "tcp(host=localhost,port=4228,timeout=30000,reconnect=tr
 
 # log messages using another server, port 4228, 30s timeout, asynchronous processing.
 SIAuto.Si.Connections = "tcp(host=myserver.example.com,port=4228,timeout=30000,reconnect=true,reconnect.interval=10s,async.enabled=true)"
+
+# log messages using localhost, port 4228, 30s timeout, nagle algorithm disabled, 256KB socket send buffer.
+SIAuto.Si.Connections = "tcp(host=localhost,port=4228,timeout=30000,nodelay=true,sndbuf=256KB)"
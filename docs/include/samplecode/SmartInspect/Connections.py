@@ -5,11 +5,18 @@ from smartinspectpython.siauto import *
 SIAuto.Si.Connections = 'file()'
 
 # log messages to file 'mylog.sil'.
-SIAuto.Si.Connections = "file(filename=""mylog.sil"", append=true)"
+SIAuto.Si.Connections = "file(filename=\"mylog.sil\", append=true)"
 
 # log messages to default file "log.sil", as well as to the SmartInspect 
 # Console viewer running on localhost.
-SIAuto.Si.Connections = "file(append=true), tcp(host=""localhost"")"
+SIAuto.Si.Connections = "file(append=true), tcp(host=\"localhost\")"
 
 # log messages to default file "log.sil", as well as to file "anotherlog.sil".
-SIAuto.Si.Connections = "file(), file(filename=""anotherlog.sil"")"
+SIAuto.Si.Connections = "file(), file(filename=\"anotherlog.sil\")"
+
+# log messages to the SmartInspect Console viewer running on localhost, using
+# asynchronous processing.  Log method calls only add the packet to a queue and
+# return immediately; a background thread sends queued packets to the Console.
+# when the queue (8 MB) is full, older packets are discarded instead of making
+# the logging thread wait (async.throttle=false).
+SIAuto.Si.Connections = "tcp(host=localhost, async.enabled=true, async.queue=8192, async.throttle=false)"
@@ -21,15 +21,21 @@ def readme(pathName:str):
     with open(pathName) as f:
         return f.read()
 
-# function to build a list of files in a directory.
-def getDirFilesList(pathName:str) -> list[str]:
+# function to build the data_files list for all files in a directory tree.
+# the directory tree is walked once; each directory's files are placed in the same
+# relative directory under targetPathName.
+def getDirTreeDataFiles(pathName:str, targetPathName:str) -> list[tuple[str, list[str]]]:
     print(str.format("getting list of files in path \"{0}\" ...", pathName))
-    dir_list = os.listdir(pathName)
-    files:list[str] = []
-    for file in dir_list:                       # process all matches.
-        if os.path.isfile(pathName + file):     # only include files (not directories)
-            files.append(str(pathName + file))
-    return files
+    dataFiles:list[tuple[str, list[str]]] = []
+    for dirPath, dirNames, fileNames in os.walk(pathName):
+        dirNames.sort()                         # process sub-directories in a consistent order.
+        relPath:str = os.path.relpath(dirPath, pathName)
+        if relPath == '.':
+            targetPath:str = targetPathName
+        else:
+            targetPath:str = targetPathName + '/' + relPath.replace(os.sep, '/')
+        dataFiles.append((targetPath, [os.path.join(dirPath, fileName) for fileName in fileNames]))
+    return dataFiles
 
 # package setup.
 setup(
@@ -45,18 +51,18 @@ setup(
     # find and include all packages in the project (anything with an '__init__.py' file).
     packages=find_packages(),
     # place documentation folder named "docs" in the package folder.
-    data_files=[
-        ('../../smartinspectpython/docs', getDirFilesList('docspdoc/build/')),
-        ('../../smartinspectpython/docs/smartinspectpython', getDirFilesList('docspdoc/build/smartinspectpython/')),
-    ],
+    data_files=getDirTreeDataFiles('docspdoc/build', '../../smartinspectpython/docs'),
     # set minimum python version requirement.
     python_requires='>3.4.1',
     # set minimum dependencies requirements.
     install_requires=[
         'pycryptodome >= 3.0',
-        'pywin32 >= 300 ; platform_system=="Windows"',
-        'watchdog == 1.0.1'
+        'pywin32 >= 300 ; platform_system=="Windows"'
     ],
+    # set optional dependencies requirements.
+    extras_require={
+        'watchdog': ['watchdog == 1.0.1'],
+    },
     # set keywords to associate this package with on Pypi.org.
     keywords=['python', 'smartinspect', 'logging', 'trace', 'tracing', 'debugging'],
     # set classifiers to associate this package with on Pypi.org.
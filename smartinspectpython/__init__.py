@@ -10,24 +10,50 @@ _________________
 </details>
 """
 
+import importlib
+
 # our package imports.
-from smartinspectpython.siargumentnullexception import SIArgumentNullException
-from smartinspectpython.siauto import SIAuto
-from smartinspectpython.siargumentoutofrangeexception import SIArgumentOutOfRangeException
-from smartinspectpython.sicolor import SIColors
-from smartinspectpython.siconfigurationtimer import SIConfigurationTimer
-from smartinspectpython.sicontrolcommandeventargs import SIControlCommandEventArgs
-from smartinspectpython.sierroreventargs import SIErrorEventArgs
-from smartinspectpython.sifiltereventargs import SIFilterEventArgs
-from smartinspectpython.siinfoeventargs import SIInfoEventArgs
-from smartinspectpython.silevel import SILevel
-from smartinspectpython.silogentryeventargs import SILogEntryEventArgs
-from smartinspectpython.simethodparmlistcontext import SIMethodParmListContext
-from smartinspectpython.siprocessfloweventargs import SIProcessFlowEventArgs
-from smartinspectpython.sisession import SISession
-from smartinspectpython.sisourceid import SISourceId
-from smartinspectpython.siwatcheventargs import SIWatchEventArgs
-from smartinspectpython.smartinspectexception import SmartInspectException
+# these are imported the first time they are referenced (see "__getattr__" below), 
+# so that importing a single module (e.g. "smartinspectpython.silevel") does not 
+# import (and initialize) every module in the package.
+_LAZY_IMPORTS:dict = {
+    'SIArgumentNullException': 'smartinspectpython.siargumentnullexception',
+    'SIArgumentOutOfRangeException': 'smartinspectpython.siargumentoutofrangeexception',
+    'SIAuto': 'smartinspectpython.siauto',
+    'SIColors': 'smartinspectpython.sicolor',
+    'SIConfigurationTimer': 'smartinspectpython.siconfigurationtimer',
+    'SIControlCommandEventArgs': 'smartinspectpython.sicontrolcommandeventargs',
+    'SIErrorEventArgs': 'smartinspectpython.sierroreventargs',
+    'SIFilterEventArgs': 'smartinspectpython.sifiltereventargs',
+    'SIInfoEventArgs': 'smartinspectpython.siinfoeventargs',
+    'SILevel': 'smartinspectpython.silevel',
+    'SILogEntryEventArgs': 'smartinspectpython.silogentryeventargs',
+    'SIMethodParmListContext': 'smartinspectpython.simethodparmlistcontext',
+    'SIProcessFlowEventArgs': 'smartinspectpython.siprocessfloweventargs',
+    'SISession': 'smartinspectpython.sisession',
+    'SISourceId': 'smartinspectpython.sisourceid',
+    'SIWatchEventArgs': 'smartinspectpython.siwatcheventargs',
+    'SmartInspectException': 'smartinspectpython.smartinspectexception',
+}
+
+
+def __getattr__(name:str) -> object:
+    """
+    Imports a package class the first time it is referenced.
+    """
+    moduleName:str = _LAZY_IMPORTS.get(name)
+    if (moduleName == None):
+        raise AttributeError("module {0!r} has no attribute {1!r}".format(__name__, name))
+
+    # import the class, and cache it so we are not called again for it.
+    value:object = getattr(importlib.import_module(moduleName), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
 
 # all classes to import when "import *" is specified.
 __all__ = [
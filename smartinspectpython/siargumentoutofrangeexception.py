@@ -19,11 +19,14 @@ class SIArgumentOutOfRangeException(Exception):
         """
         Initializes a new instance of the class with the name of the parameter that causes this exception.
         """
-        super().__init__(self)
+        # note that the parameter name (and not the exception itself) is passed
+        # as the exception argument, so the exception does not reference itself.
+        super().__init__(paramName)
 
         # initialize instance.
+        # the message is built on first reference, since most callers never read it.
         self.__paramName = paramName
-        self.__message = "The \"{0}\" parameter is outside the allowable range of values as defined by the invoked method.".format(paramName)
+        self.__message = None
 
 
     @property
@@ -31,6 +34,8 @@ class SIArgumentOutOfRangeException(Exception):
         """ 
         Gets the error message and the parameter name, or only the error message if no parameter name is set.
         """
+        if (self.__message is None):
+            self.__message = "The \"{0}\" parameter is outside the allowable range of values as defined by the invoked method.".format(self.__paramName)
         return self.__message
     
 
@@ -46,4 +51,4 @@ class SIArgumentOutOfRangeException(Exception):
         """ 
         Gets the error message and the parameter name, or only the error message if no parameter name is set.
         """
-        return "ArgumentNullException: " + self.__message
+        return "ArgumentNullException: " + self.Message
@@ -54,6 +54,8 @@ __all__ = [
 ]
 
 import os
+import sys
+import threading
 
 # our package imports.
 from .siargumentnullexception import SIArgumentNullException
@@ -70,14 +72,73 @@ from .simethodparmlistcontext import SIMethodParmListContext
 from .siprocessfloweventargs import SIProcessFlowEventArgs
 from .sisession import SISession
 from .sisourceid import SISourceId
-from .siutils import static_init
 from .siwatcheventargs import SIWatchEventArgs
 from .smartinspect import SmartInspect
 from .smartinspectexception import SmartInspectException
 
 
-@static_init    # indicate we have a static init method.
-class SIAuto:
+_DEFAULT_LEVEL:SILevel = SILevel.Debug
+""" Logging level used for the automatically created SmartInspect and SISession instances. """
+
+_APP_NAME:str = os.path.basename(sys.argv[0]) if (sys.argv and sys.argv[0]) else "Python"
+""" 
+Application name used for the automatically created SmartInspect instance (the entry point 
+name, or "Python" if there is none, e.g. for embedded interpreters). 
+"""
+
+
+class _SIAutoType(type):
+    """
+    Metaclass of the SIAuto class, which creates the SIAuto.Si and SIAuto.Main
+    static instances the first time that either one of them is referenced
+    (instead of when the module is imported).
+
+    See the SIAuto.Si and SIAuto.Main properties for more information.
+    """
+
+    @property
+    def Si(cls) -> SmartInspect:
+        """ 
+        Gets / sets the SIAuto.Si static property value.
+        """
+        if (cls._Si is None):
+            cls.static_init()
+        return cls._Si
+
+    @Si.setter
+    def Si(cls, value:SmartInspect) -> None:
+        """ 
+        Sets the SIAuto.Si static property value.
+        """
+        # note that the static instances are created first (if necessary), so that 
+        # Main is not replaced when it is referenced later.
+        if (cls._Si is None):
+            cls.static_init()
+        cls._Si = value
+
+
+    @property
+    def Main(cls) -> SISession:
+        """ 
+        Gets / sets the SIAuto.Main static property value.
+        """
+        if (cls._Si is None):
+            cls.static_init()
+        return cls._Main
+
+    @Main.setter
+    def Main(cls, value:SISession) -> None:
+        """ 
+        Sets the SIAuto.Main static property value.
+        """
+        # note that the static instances are created first (if necessary), so that 
+        # Si is not replaced when it is referenced later.
+        if (cls._Si is None):
+            cls.static_init()
+        cls._Main = value
+
+
+class SIAuto(metaclass=_SIAutoType):
     """
     Provides automatically created objects for using the SmartInspect and SISession classes.
 
@@ -88,6 +149,9 @@ class SIAuto:
     The SmartInspect.Connections property of Si is set to "tcp(host=localhost)", the
     SmartInspect.AppName property to "Auto" and the SISession.Name property to "Main".
 
+    The Si and Main instances are created the first time that either one of them
+    is referenced, so importing this module does not create them.
+
     Threadsafety:
         The public static members of this class are thread-safe.
 
@@ -104,50 +168,85 @@ class SIAuto:
     </details>  
     """
 
+    # static fields (see the Si and Main properties).
+    _Si:SmartInspect = None
+    _Main:SISession = None
+    _StaticInitLock:threading.Lock = threading.Lock()
+
     """
     ## Static Properties
     """
 
-    # static properties.
-    Si:SmartInspect = None   
-    """ 
-    SmartInspect logging instance (automatically created). 
-    """
+    # note that the static properties are implemented by the metaclass (so that they
+    # can be referenced and set on the class); the properties below make them
+    # available to instances of the class as well.
 
+    @property
+    def Si(self) -> SmartInspect:
+        """ 
+        SmartInspect logging instance (automatically created). 
+        """
+        return SIAuto.Si
 
-    Main:SISession = None
-    """ 
-    SmartInspect logging Session instance ('Main', automatically created). 
+    @Si.setter
+    def Si(self, value:SmartInspect) -> None:
+        """ 
+        Sets the Si property value.
+        """
+        SIAuto.Si = value
 
-    The SISession.Name is set to "Main" and the SISession.Parent to SIAuto.Si.
 
-    <details>
-        <summary>Sample Code</summary>
-    ``` python
-    .. include:: ../docs/include/samplecode/SIAuto/Main.py
-    ```
-    </details>   
-    """
+    @property
+    def Main(self) -> SISession:
+        """ 
+        SmartInspect logging Session instance ('Main', automatically created). 
+
+        The SISession.Name is set to "Main" and the SISession.Parent to SIAuto.Si.
+
+        <details>
+            <summary>Sample Code</summary>
+        ``` python
+        .. include:: ../docs/include/samplecode/SIAuto/Main.py
+        ```
+        </details>   
+        """
+        return SIAuto.Main
+
+    @Main.setter
+    def Main(self, value:SISession) -> None:
+        """ 
+        Sets the Main property value.
+        """
+        SIAuto.Main = value
 
 
     @classmethod
     def static_init(cls) -> None:
         """ 
         Initializes a new static instance of the class.
+
+        This is called the first time that the Si or Main property is referenced.
         """
-        # Note - at this point, you cannot call any of the static methods in this class,
-        # as we are still in the initilization phase!
-
-        # create a new smartinspect instance, using the
-        # entry point name as the appname.
-        cls.Si = SmartInspect(os.path.basename(os.sys.argv[0]))
-
-        # set default connections string, logging levels, and disable by default.
-        cls.Si.Connections = 'tcp(host=localhost)'
-        cls.Si.Enabled = False
-        cls.Si.Level = SILevel.Debug
-        cls.Si.DefaultLevel = SILevel.Debug
-
-        # create new default session, named "Main".
-        cls.Main = cls.Si.AddSession('Main', True)
-        cls.Main.Level = SILevel.Debug
+        with (cls._StaticInitLock):
+
+            # if another thread initialized the instances already, then we are done.
+            if (cls._Si is not None):
+                return
+
+            # create a new smartinspect instance, using the
+            # entry point name as the appname.
+            si:SmartInspect = SmartInspect(_APP_NAME)
+
+            # set default connections string, logging levels, and disable by default.
+            si.Connections = 'tcp(host=localhost)'
+            si.Enabled = False
+            si.Level = _DEFAULT_LEVEL
+            si.DefaultLevel = _DEFAULT_LEVEL
+
+            # create new default session, named "Main".
+            main:SISession = si.AddSession('Main', True)
+            main.Level = _DEFAULT_LEVEL
+
+            # note that Main is assigned before Si, since Si is the "initialized" indicator.
+            cls._Main = main
+            cls._Si = si
@@ -41,6 +41,9 @@ class SIBinaryFormatter(SIFormatter):
     MICROSECONDS_PER_DAY:int = 86400000000 # number of microseconds in 1 day
     DAY_OFFSET_DELPHI_DEFAULT:int = 25569  # number of days between 01/01/1970 (epoch date) and 12/30/1899 (Delphi default date)
 
+    _PACKET_HEADER:struct.Struct = struct.Struct('<Hl')
+    """ Packet header layout: packet type as Delphi Word, data size as Delphi Integer (little endian). """
+
     def __init__(self) -> None:
         """
         Initializes a new instance of the class.
@@ -153,6 +156,15 @@ class SIBinaryFormatter(SIFormatter):
         """
         Copies bytes from one stream to another.
         """
+        # if copying from an in-memory stream, then write the bytes directly from
+        # its buffer; this avoids allocating a temporary bytes object per chunk.
+        # note that the buffer views must be released before the stream can resize.
+        if (isinstance(fromStream, BytesIO)):
+            with fromStream.getbuffer() as buffer, buffer[:count] as data:
+                toStream.write(data)
+                fromStream.seek(data.nbytes)
+            return
+
         # reset from stream position to zero
         fromStreamPos:int = fromStream.tell()
         fromStream.seek(0)
@@ -392,6 +404,6 @@ class SIBinaryFormatter(SIFormatter):
         """
 
         if (self._fSize > 0):
-            self._WriteShortToStream(stream, int(self._fPacket.PacketType.value))
-            self._WriteIntToStream(stream, self._fSize)
+            # write packet header (packet type Word + data size Integer) in one call.
+            stream.write(SIBinaryFormatter._PACKET_HEADER.pack(int(self._fPacket.PacketType.value), self._fSize))
             self._CopyStream(stream, self._fStream, self._fSize)
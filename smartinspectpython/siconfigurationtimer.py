@@ -1,10 +1,15 @@
-import _threading_local
-from ctypes import ArgumentError
 import os
 import threading
 import time
-from watchdog.observers import Observer
-from watchdog.events import PatternMatchingEventHandler, FileModifiedEvent, FileCreatedEvent, FileDeletedEvent
+
+# watchdog package is optional; if it is not installed, then the configuration
+# filepath is polled for changes instead.
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import PatternMatchingEventHandler
+except ImportError:
+    Observer = None
+    PatternMatchingEventHandler = None
 
 # our package imports.
 from .siargumentnullexception import SIArgumentNullException
@@ -21,7 +26,9 @@ class SIConfigurationTimer:
     and reloads the configuration when it does.
     
     A watchdog `Observer` class is used to monitor the configuration filepath
-    for changes (create, update, delete).
+    for changes (create, update, delete).  If the watchdog package is not
+    installed, then the configuration filepath is polled for changes every
+    `POLL_INTERVAL` seconds instead.
         
     The `SmartInspect.LoadConfiguration` method is called if the configuration 
     filepath is created or changed.  
@@ -49,6 +56,19 @@ class SIConfigurationTimer:
     </details>
     """
 
+    POLL_INTERVAL:float = 2.0
+    """
+    Interval (in seconds) at which the configuration filepath is checked for
+    changes if the watchdog package is not installed.
+    """
+
+    RELOAD_DEBOUNCE_INTERVAL:float = 0.5
+    """
+    Interval (in seconds) in which duplicate modified events for an unchanged
+    configuration filepath are ignored.  Editors (and some platforms) can raise
+    several modified events for a single save of the file.
+    """
+
     def __init__(self, smartInspect:SmartInspect, filePath:str) -> None:
         """
         Initializes a new instance of the class.
@@ -72,11 +92,15 @@ class SIConfigurationTimer:
             raise SIArgumentNullException("filePath")
 
         # initialize instance.
-        self._fLock:object = _threading_local.RLock()
+        self._fLock:threading.Lock = threading.Lock()
         self._fSmartInspect:SmartInspect = smartInspect
         self._fFilePath:str = filePath
         self._fStarted = False
-        self._fStopRequested = False
+        self._fStopEvent:threading.Event = threading.Event()
+        self._fObserver:Observer = None
+        self._fThread:threading.Thread = None
+        self._fLastReloadStat:tuple = None
+        self._fLastReloadTime:float = 0.0
 
         # start monitoring the filepath for changes.
         self.Start()
@@ -96,109 +120,131 @@ class SIConfigurationTimer:
         return False
 
 
-    def _MonitorFileTask(self, instance) -> None:
+    def _CreateObserver(self) -> Observer:
         """
-        Starts a watchdog `Observer` class to monitor the configuration filepath
-        for changes (create,update,delete).
-        
-        The `SmartInspect.LoadConfiguration` method is called if the configuration 
-        filepath is created or changed.  
-        
-        The `SmartInspect.Enabled` property is set to False if the configuration 
-        filepath is deleted.  
+        Creates a watchdog `Observer` class to monitor the configuration filepath
+        for changes.
+
+        Returns:
+            The observer, which has not been started yet.
         """
-        fileObserver:Observer = None
-        
-        try:
-            
-            # the event handler is the object that will be notified when something happens 
-            # on the filesystem we are monitoring.
-            # the pattern array to match should be file base name(s) (e.g. name.extension).
-            baseName:str = os.path.basename(self._fFilePath)   #filename.extension
-            fileEventHandler = PatternMatchingEventHandler(patterns=[baseName], 
-                                                           ignore_patterns=None, 
-                                                           ignore_directories=True, 
-                                                           case_sensitive=False)
-            
-            # add event handlers for various file operations.
-            fileEventHandler.on_created = self._OnCreated
-            fileEventHandler.on_deleted = self._OnDeleted
-            fileEventHandler.on_modified = self._OnModified
-
-            # create the observer, which will monitor the filesystem, looking for changes 
-            # that will be handled by the event handler.
-            # in our case, we are looking for changes to 1 file in a single directory.
-            dirPath:str = os.path.dirname(self._fFilePath)
-            if dirPath is None or len(dirPath) == 0:
-                dirPath = "."
-            fileObserver = Observer()
-            fileObserver.schedule(fileEventHandler, dirPath, recursive=False)
-
-            # start the observer.
-            fileObserver.start()
-
-            # process until we are asked to stop by main thread.
-            while (True):
-
-                with (self._fLock):
-        
-                    # were we asked to stop?  if so, then we are done.
-                    if (self._fStopRequested):
-                        break
+        # the event handler is the object that will be notified when something happens 
+        # on the filesystem we are monitoring.
+        # the pattern array to match should be file base name(s) (e.g. name.extension).
+        baseName:str = os.path.basename(self._fFilePath)   #filename.extension
+        fileEventHandler = PatternMatchingEventHandler(patterns=[baseName], 
+                                                       ignore_patterns=None, 
+                                                       ignore_directories=True, 
+                                                       case_sensitive=False)
+
+        # add event handlers for various file operations.
+        fileEventHandler.on_created = lambda event: self._OnCreated(event.src_path)
+        fileEventHandler.on_deleted = lambda event: self._OnDeleted(event.src_path)
+        fileEventHandler.on_modified = lambda event: self._OnModified(event.src_path)
+
+        # create the observer, which will monitor the filesystem, looking for changes 
+        # that will be handled by the event handler.
+        # in our case, we are looking for changes to 1 file in a single directory.
+        dirPath:str = os.path.dirname(self._fFilePath)
+        if dirPath is None or len(dirPath) == 0:
+            dirPath = "."
+        fileObserver = Observer()
+        fileObserver.schedule(fileEventHandler, dirPath, recursive=False)
+        return fileObserver
+
+
+    def _PollFile(self) -> None:
+        """
+        Polls the configuration filepath for changes every `POLL_INTERVAL` 
+        seconds, until a stop is requested.
 
-                    # is main thread still alive?  if not, then we are done.
-                    if (not threading.main_thread().is_alive()):
-                        break
+        This is only used if the watchdog package is not installed.
+        """
+        lastModified:float = self._GetFileModifiedTime()
 
-                    # sleep for a time, giving other threads a chance to do their thing.
-                    time.sleep(5)
+        # process until we are asked to stop; the stop event is signalled by the 
+        # Stop method, so we wake up immediately when asked to stop.
+        while (not self._fStopEvent.wait(SIConfigurationTimer.POLL_INTERVAL)):
 
-        except Exception as ex:
-        
-            # ignore exceptions.
-            pass
-        
-        finally:
-        
-            # if observer was started, then stop it.
-            if fileObserver is not None:
-                fileObserver.stop()
-                fileObserver.join()
-    
-            # indicate we are not monitoring.
-            self._fStarted = False
+            modified:float = self._GetFileModifiedTime()
+            if (modified == lastModified):
+                continue
 
-            # reset stop requested status.
-            self._fStopRequested = False
+            if (modified is None):
+                self._OnDeleted(self._fFilePath)
+            else:
+                if (lastModified is None):
+                    self._OnCreated(self._fFilePath)
+                self._OnModified(self._fFilePath)
+
+            lastModified = modified
+
+
+    def _GetFileModifiedTime(self) -> float:
+        """
+        Returns the last modified time of the configuration filepath, or None
+        if the file does not exist.
+        """
+        try:
+            return os.stat(self._fFilePath).st_mtime
+        except OSError:
+            return None
 
 
-    def _OnCreated(self, event:FileCreatedEvent):
+    def _OnCreated(self, filePath:str):
         """ 
         Called when a configuration filepath has been created. 
         """
-        self._fSmartInspect.RaiseInfoEvent("SI Configuration File was created: \"{0}\"".format(event.src_path))
+        si:SmartInspect = self._fSmartInspect
+        if (si.InfoEvent.hasHandlers()):
+            si.RaiseInfoEvent("SI Configuration File was created: \"{0}\"".format(filePath))
+
         # we won't reload it here, since an `_OnChanged` event will be fired 
         # immediately after to issue the reload.
 
 
-    def _OnDeleted(self, event:FileDeletedEvent):
+    def _OnDeleted(self, filePath:str):
         """ 
         Called when a configuration filepath has been deleted. 
-        
+
         SmartInspect logger will be disabled when the monitored configuration file is deleted.
         """
-        self._fSmartInspect.RaiseInfoEvent("SI Configuration File was deleted; disabling SmartInspect logger for file \"{0}\"".format(event.src_path))
-        self._fSmartInspect.Enabled = False
+        si:SmartInspect = self._fSmartInspect
+        if (si.InfoEvent.hasHandlers()):
+            si.RaiseInfoEvent("SI Configuration File was deleted; disabling SmartInspect logger for file \"{0}\"".format(filePath))
+        si.Enabled = False
 
 
-    def _OnModified(self, event:FileModifiedEvent):
+    def _OnModified(self, filePath:str):
         """ 
         Called when a configuration filepath has been modified. 
-        
+
+        Duplicate modified events that are raised for the same file contents 
+        within `RELOAD_DEBOUNCE_INTERVAL` seconds of the last reload are ignored.
         """
-        self._fSmartInspect.RaiseInfoEvent("SI Configuration File was changed; reloading configuration from file \"{0}\"".format(event.src_path))
-        self._fSmartInspect.LoadConfiguration(event.src_path)
-    
+        # get the file modified time and size, which identify the file contents.
+        try:
+            st = os.stat(filePath)
+            fileStat:tuple = (st.st_mtime_ns, st.st_size)
+        except OSError:
+            fileStat:tuple = None
+
+        # ignore the event if the file has not changed since we last reloaded it.
+        now:float = time.monotonic()
+        if (fileStat != None) \
+        and (fileStat == self._fLastReloadStat) \
+        and ((now - self._fLastReloadTime) < SIConfigurationTimer.RELOAD_DEBOUNCE_INTERVAL):
+            return
+
+        self._fLastReloadStat = fileStat
+        self._fLastReloadTime = now
+
+        # only build the info message if someone is listening for it.
+        si:SmartInspect = self._fSmartInspect
+        if (si.InfoEvent.hasHandlers()):
+            si.RaiseInfoEvent("SI Configuration File was changed; reloading configuration from file \"{0}\"".format(filePath))
+        si.LoadConfiguration(filePath)
+
 
     def Start(self) -> None:
         """
@@ -208,24 +254,42 @@ class SIConfigurationTimer:
         is created.  It can also be called after issuing a "Stop" method
         call, to restart monitoring of the configuration file.
 
-        It will start a new thread named "SiConfigFileMonitorTask" that will
-        execute the watchdog Observer that monitors the specified configuration 
-        filepath for changes.
+        It will start a watchdog Observer that monitors the specified configuration 
+        filepath for changes.  If watchdog is not installed, then it will start a
+        new thread named "SiConfigFileMonitorTask" that polls the filepath instead.
         """
         with (self._fLock):
 
-            # if threadtask is already running then don't bother.
+            # if monitoring is already started then don't bother.
             if (self._fStarted):
                 return
 
             # reset stop requested status.
-            self._fStopRequested = False
+            self._fStopEvent.clear()
+
+            try:
+
+                if (Observer is not None):
+
+                    # start the observer; note that the observer runs on its own 
+                    # daemon thread, so it will not keep the process alive.
+                    self._fObserver = self._CreateObserver()
+                    self._fObserver.start()
+
+                else:
+
+                    # start the thread task to poll the file.
+                    self._fThread = threading.Thread(target=self._PollFile, daemon=True)
+                    self._fThread.name = "SiConfigFileMonitorTask"
+                    self._fThread.start()
+
+            except Exception as ex:
+
+                # ignore exceptions.
+                self._fObserver = None
+                self._fThread = None
+                return
 
-            # start the thread task to monitor the file.
-            self._fThread = threading.Thread(target=self._MonitorFileTask, args=(self,))
-            self._fThread.name = "SiConfigFileMonitorTask"
-            self._fThread.start()
-                    
             # indicate we are monitoring.
             self._fStarted = True
 
@@ -236,16 +300,26 @@ class SIConfigurationTimer:
         """
         with (self._fLock):
 
-            # if threadtask has not started yet then we are done.
+            # if monitoring has not started yet then we are done.
             if (not self._fStarted):
                 return
 
-            # inform the thread task we want it to stop.
-            self._fStopRequested = True
+            # inform the polling thread task we want it to stop; this wakes it 
+            # up immediately if it is waiting.
+            self._fStopEvent.set()
 
-        # wait for the monitoring threadtask to finish up.
-        if (self._fThread != None):
-            self._fThread.join()
+            # reset monitoring objects.
+            fileObserver:Observer = self._fObserver
+            thread:threading.Thread = self._fThread
+            self._fObserver = None
+            self._fThread = None
+
+            # indicate we are not monitoring.
+            self._fStarted = False
 
-        # reset threadtask object.
-        self._fThread = None
+        # wait for the observer / polling thread task to finish up.
+        if (fileObserver != None):
+            fileObserver.stop()
+            fileObserver.join()
+        if (thread != None):
+            thread.join()
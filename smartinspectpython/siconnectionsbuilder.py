@@ -1,3 +1,7 @@
+# system imports.
+from enum import Enum
+from functools import lru_cache
+
 # our package imports.
 from .siargumentnullexception import SIArgumentNullException
 from .sifilerotate import SIFileRotate
@@ -7,6 +11,17 @@ from .silevel import SILevel
 from .siutils import export
 
 
+@lru_cache(maxsize=64)
+def _escape_backslashes(value:str) -> str:
+    """
+    Replaces any backslash characters in the value with double-backslash characters.
+
+    Results are cached, as the same values (e.g. log file paths) are usually 
+    escaped repeatedly.  The cache holds references to at most 64 values.
+    """
+    return value.replace("\\", "\\\\")
+
+
 @export
 class SIConnectionsBuilder:
     """
@@ -17,16 +32,18 @@ class SIConnectionsBuilder:
     connections strings, please refer to the SmartInspect.Connections property.
     """
 
+    __slots__ = ("_fHasOptions", "_fBuilder")
+
     def __init__(self) -> None:
         """
         Initializes a new instance of the class.
         """
         self._fHasOptions:bool = False
-        self._fBuilder:str = ""  # StringBuilder
+        self._fBuilder:list = []  # StringBuilder; joined by the Connections property.
 
 
     @property
-    def Connections(self) -> bool:
+    def Connections(self) -> str:
         """
         Get the Connections property value.
 
@@ -34,7 +51,32 @@ class SIConnectionsBuilder:
         has previously been built with the BeginProtocol, AddOption
         and EndProtocol methods.
         """
-        return self._fBuilder
+        return "".join(self._fBuilder)
+
+
+    def _AppendRaw(self, key:str, valuestring:str) -> None:
+        """
+        Adds a new option to the current protocol section, using a value that 
+        is already formatted (and escaped if necessary).
+
+        Args:
+            key (str):
+                Option key name to add.
+            valuestring (str):
+                Option key formatted value to add.
+
+        Raises:
+            SIArgumentNullException:
+                The key parameter is null.
+        """
+        if (key == None):
+            raise SIArgumentNullException("key")
+
+        if (self._fHasOptions):
+            self._fBuilder.append(", ")
+
+        self._fBuilder.extend((key, "=\"", valuestring, "\""))
+        self._fHasOptions = True
 
 
     def AddOptionBool(self, key:str, value:bool) -> None:
@@ -47,10 +89,7 @@ class SIConnectionsBuilder:
             value (bool):
                 Option key boolean value to add.
         """
-        valuestring = "false"
-        if (value):
-            valuestring = "true"
-        self.AddOptionString(key, valuestring)
+        self._AppendRaw(key, "true" if value else "false")
 
     
     def AddOptionFileRotate(self, key:str, value:SIFileRotate) -> None:
@@ -63,8 +102,7 @@ class SIConnectionsBuilder:
             value (SIFileRotate):
                 Option key SIFileRotate value to add.
         """
-        valuestring = str(value.name.lower())
-        self.AddOptionString(key, valuestring)
+        self._AppendRaw(key, value.name.lower())
 
 
     def AddOptionInteger(self, key:str, value:int) -> None:
@@ -77,8 +115,7 @@ class SIConnectionsBuilder:
             value (int):
                 Option key integer value to add.
         """
-        valuestring = str(value)
-        self.AddOptionString(key, valuestring)
+        self._AppendRaw(key, str(value))
 
 
     def AddOptionLevel(self, key:str, value:SILevel) -> None:
@@ -91,8 +128,55 @@ class SIConnectionsBuilder:
             value (SILevel):
                 Option key Level value to add.
         """
-        valuestring = str(value.name.lower())
-        self.AddOptionString(key, valuestring)
+        self._AppendRaw(key, value.name.lower())
+
+
+    def AddOptions(self, **options) -> None:
+        """
+        Adds multiple options to the current protocol section.
+
+        Args:
+            options (dict):
+                Option key names and values to add (e.g. `level=SILevel.Debug, maxsize=1024`).
+
+        Raises:
+            SIArgumentNullException:
+                An option value is null.
+
+        This method adds the options in the order they are specified, and is the
+        same as calling the AddOption method that matches the type of each value:
+        bool values are added as "true" / "false", enum values (e.g. SILevel,
+        SIFileRotate) as their lower-case name, integer values as their string
+        representation, and string values are escaped if necessary.
+
+        Option key names that are not valid Python identifiers can be passed with
+        a dictionary (e.g. `AddOptions(**{"async.enabled": True})`).
+        """
+        builder:list = self._fBuilder
+        hasOptions:bool = self._fHasOptions
+
+        for key, value in options.items():
+
+            if (value == None):
+                raise SIArgumentNullException(key)
+
+            # note that bool must be checked before int, as bool is a subclass of int.
+            if (isinstance(value, bool)):
+                valuestring = "true" if value else "false"
+            elif (isinstance(value, Enum)):
+                valuestring = value.name.lower()
+            elif (isinstance(value, int)):
+                valuestring = str(value)
+            else:
+                valuestring = SIConnectionsBuilder.Escape(value)
+
+            if (hasOptions):
+                builder.append(", ")
+
+            builder.extend((key, "=\"", valuestring, "\""))
+            hasOptions = True
+
+        self._fHasOptions = hasOptions
 
 
     def AddOptionString(self, key:str, value:str) -> None:
@@ -114,14 +198,7 @@ class SIConnectionsBuilder:
         if (value == None):
             raise SIArgumentNullException("value")
 
-        if (self._fHasOptions):
-            self._fBuilder += ", "
-
-        self._fBuilder += key
-        self._fBuilder += "=\""
-        self._fBuilder += self.Escape(value)
-        self._fBuilder += "=\""
-        self._fHasOptions = True
+        self._AppendRaw(key, SIConnectionsBuilder.Escape(value))
 
 
     def BeginProtocol(self, protocolName:str) -> None:
@@ -141,10 +218,9 @@ class SIConnectionsBuilder:
             raise SIArgumentNullException("protocolName")
 
         if (len(self._fBuilder) != 0):
-            self._fBuilder += ", "
+            self._fBuilder.append(", ")
 
-        self._fBuilder += protocolName
-        self._fBuilder += "("
+        self._fBuilder.extend((protocolName, "("))
         self._fHasOptions = False
 
 
@@ -155,7 +231,7 @@ class SIConnectionsBuilder:
         After this method has been called, the Connections property
         returns an empty string.
         """
-        self._fBuilder = ""
+        self._fBuilder = []
 
 
     def EndProtocol(self) -> None:
@@ -164,10 +240,11 @@ class SIConnectionsBuilder:
         This method ends the current protocol. To begin a new protocol
         section, use the BeginProtocol method.
         """
-        self._fBuilder += ")"
+        self._fBuilder.append(")")
 
 
-    def Escape(self, value:str) -> str:
+    @staticmethod
+    def Escape(value:str) -> str:
         """
         Replaces any backslash characters in the value with double-backslash characters.
 
@@ -178,4 +255,7 @@ class SIConnectionsBuilder:
         Returns:
             The escaped value.
         """
-        return value.replace("\\", "\\\\")
+        # most option values do not contain backslashes, so return them as-is.
+        if ("\\" not in value):
+            return value
+        return _escape_backslashes(value)
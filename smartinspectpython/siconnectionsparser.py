@@ -1,3 +1,6 @@
+# external package imports.
+import re
+
 # our package imports.
 from .siargumentnullexception import SIArgumentNullException
 from .siconnectionfoundeventargs import SIConnectionFoundEventArgs
@@ -22,6 +25,12 @@ class SIConnectionsParser:
         This class is not guaranteed to be thread-safe.
     """
 
+    _UNQUOTED_RUN:re.Pattern = re.compile(r'[^")]+')
+    """ Matches a run of unquoted option characters up to the next quote or closing parenthesis. """
+
+    _QUOTED_RUN:re.Pattern = re.compile(r'[^"]+')
+    """ Matches a run of quoted option characters up to the next quote. """
+
     def __init__(self) -> None:
         """ 
         Initializes a new instance of the class.
@@ -96,7 +105,7 @@ class SIConnectionsParser:
         i:int = 0
         c:chr
         name:str = ""
-        options:str = ""
+        options:list[str] = []
         parselen:int = len(connections)
 
         # This code attempts to parse connection strings for protocol definitions delimited by comma's.  
@@ -107,25 +116,32 @@ class SIConnectionsParser:
         while (i < parselen - 1):
 
             # process the protocol NAME portion of the connection string.
-            c = connections[i]
-            while (i < parselen - 1):
-                i = i + 1
-                name += c
-                c = connections[i]
-                if (c == '('):
-                    break
+            # the first character is always part of the name.
+            delim:int = connections.find('(', i + 1)
 
             # did we find the '(' delimiter? if not, then it's an error!
-            if (c != '('):
-                raise SmartInspectException("Missing \"(\" at position " + str(i + 1) + " in protocol connection string!")
+            if (delim == -1):
+                raise SmartInspectException("Missing \"(\" at position " + str(parselen) + " in protocol connection string!")
+
+            name = connections[i:delim]
+            c = '('
 
             # point to character after "(" delimiter.
-            if (i < parselen):
-                i = i + 1
+            i = delim + 1
 
             # process the OPTIONS portion of the connection string.
             quoted:bool = False
             while (i < parselen):
+
+                # copy runs of characters that need no special handling in one step;
+                # only quotes (and closing parenthesis outside of quotes) stop a run.
+                run = (SIConnectionsParser._QUOTED_RUN if quoted else SIConnectionsParser._UNQUOTED_RUN).match(connections, i)
+                if (run != None):
+                    options.append(run.group())
+                    i = run.end()
+                    c = connections[i - 1]
+                    continue
+
                 c = connections[i]
                 i = i + 1
                 if (c == '"'):
@@ -135,13 +151,12 @@ class SIConnectionsParser:
                             continue
                         else:
                             i = i + 1  # skip one quote
-                            options = options + '"'
+                            options.append('""')
                     else:
                         quoted = (not quoted)
                         continue
-                elif (c == ')' and not quoted):
+                elif (c == ')'):
                     break
-                options = options + c
 
             # if the options was quoted, was closing quote provided?  if not, then it's an error!
             if (quoted):
@@ -155,8 +170,8 @@ class SIConnectionsParser:
                 i = i + 1
 
             # raise event to inform interested parties that we found a protocol connection string.
-            self._RaiseConnectionFoundEvent(name, options)
+            self._RaiseConnectionFoundEvent(name, "".join(options))
 
             # reset protocol and options for next protocol connection string.
             name = ""
-            options = ""
+            options = []
@@ -4,7 +4,7 @@ from .sicolor import SIColor
 # constants are placed in this file if they are used across multiple files.
 # the only exception to this is for the VERSION constant, which is placed here for convenience.
 
-VERSION:str = "3.0.34"
+VERSION:str = "3.0.35"
 """ 
 Current version of the SmartInspect Python3 Library. 
 """
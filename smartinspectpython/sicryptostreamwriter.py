@@ -1,6 +1,6 @@
 from Crypto.Cipher import AES
 from Crypto.Util.Padding import pad
-from io import BytesIO, BufferedWriter
+from io import BufferedWriter, RawIOBase
 
 # our package imports.
 from .siargumentnullexception import SIArgumentNullException
@@ -10,16 +10,43 @@ from .siutils import export
 
 
 @export
-class SICryptoStreamWriter(BytesIO):
+class SICryptoStreamWriter:
     """
     Cryptographic stream writer class used to encrypt data and write to a destination
     stream.
 
     This class utilizes PyCryptodome cryptography support.  More info can be found here:
     https://pycryptodome.readthedocs.io/en/latest/index.html
+
+    Block cipher modes (e.g. CBC) buffer data until a full block is available, and pad
+    the last block when the stream is closed.  Counter (CTR) mode ciphers encrypt the 
+    data of each write as-is, with no buffering or padding.
+    """
+
+    __slots__ = ("_fCipher", "_fPadMethod", "_fStream", "_fBufferPos", "_fBuffer", "_fOutBuffer", "_fBlockAligned", "_fPending")
+
+    RAW_STREAM_BUFFER_SIZE:int = 0x10000
+    """
+    Size (in bytes) of the buffer used to coalesce encrypted writes if the destination
+    stream is an unbuffered (raw) stream.
+    """
+
+    BATCH_SIZE:int = 0x2000
+    """
+    Number of bytes of unencrypted data that are collected before they are encrypted,
+    unless the stream is flushed (or closed) first.  Collecting the data of several 
+    small writes (e.g. the parts of a log packet) allows it to be encrypted with a 
+    single cipher call.
+    """
+
+    OUTPUT_BUFFER_SIZE:int = 0x10000
+    """
+    Initial size (in bytes) of the reusable buffer that encrypted data is written to
+    before it is written to the destination stream.  The buffer grows if a single 
+    write needs more room.
     """
 
-    def __init__(self, stream:BufferedWriter, cipher, padMethod:str='pkcs7') -> None:
+    def __init__(self, stream:BufferedWriter, cipher, padMethod:str='pkcs7', blockAligned:bool=True) -> None:
         """
         Initializes a new instance of the class.
 
@@ -30,34 +57,84 @@ class SICryptoStreamWriter(BytesIO):
                 AES Cipher object used to encrypt the data.
             padMethod (str):
                 Method used for padding bytes to be encoded; possible values are 'pkcs7' (default), 'iso7816' or 'x923'.
+            blockAligned (bool):
+                True (default) if the cipher mode needs data in full blocks (e.g. CBC), which are
+                buffered and padded; False if the cipher mode encrypts data of any length as-is
+                (e.g. CTR), in which case no buffering or padding is done.
 
         Raises:
             SIArgumentNullException:
                 Thrown if the cipher or stream argument is null.
         """
         # validations.
-        if (cipher == None):
+        if (cipher is None):
             raise SIArgumentNullException("cipher")
-        if (stream == None):
+        if (stream is None):
             raise SIArgumentNullException("stream")
-        if (padMethod == None):
+        if (padMethod is None):
             padMethod = 'pkcs7'
 
-        # init base class, using the cipher block size as the buffer size to allocate.
-        super().__init__(bytes(cipher.block_size))
+        # if the destination stream is unbuffered, then wrap it in a buffered stream
+        # so that encrypted blocks are not written to the destination one at a time.
+        if (isinstance(stream, RawIOBase)):
+            stream = BufferedWriter(stream, SICryptoStreamWriter.RAW_STREAM_BUFFER_SIZE)
 
         # initialize instance.
         self._fCipher = cipher                         # cipher object used to encrypt data.
         self._fPadMethod = padMethod                   # padding method for cipher text (e.g. 'pkcs7', etc).
         self._fStream = stream                         # reference to the stream that we will write encrypted data to.
         self._fBufferPos:int = 0                       # the current position of the temporary buffer.
-        self._fBuffer:memoryview = self.getbuffer()    # the temporary buffer.
+        self._fBuffer:memoryview = memoryview(bytearray(cipher.block_size))  # the temporary buffer.
+        self._fOutBuffer:bytearray = bytearray(SICryptoStreamWriter.OUTPUT_BUFFER_SIZE)  # reusable encrypted data buffer.
+        self._fBlockAligned:bool = blockAligned        # True if cipher needs full (padded) blocks.
+        self._fPending:bytearray = bytearray()         # unencrypted data collected since the last encrypt.
+
+
+    @classmethod
+    def NewAesCtr(cls, stream:BufferedWriter, key:bytes, nonce:bytes) -> 'SICryptoStreamWriter':
+        """
+        Creates a new instance of the class that encrypts data using AES in counter (CTR) mode.
+
+        Args:
+            stream (BufferedWriter):
+                Destination stream (BufferedWriter object) that encrypted data will be written to.
+            key (bytes):
+                AES key (16, 24 or 32 bytes long).
+            nonce (bytes):
+                Counter nonce; it must never be reused with the same key.
+
+        Returns:
+            A new SICryptoStreamWriter instance.
+
+        CTR mode does not chain blocks, so the hardware AES instructions (AES-NI) can 
+        process several blocks at once, and no padding is required.  Note that the 
+        SmartInspect Console only reads CBC encrypted log files (see SIFileProtocol),
+        so this is intended for encrypted streams that are read by other tools.
+        """
+        cipher = AES.new(key, AES.MODE_CTR, nonce=nonce, use_aesni=True)
+        return cls(stream, cipher, blockAligned=False)
+
+
+    def _EncryptPending(self) -> None:
+        """
+        Encrypts the unencrypted data collected by previous writes (if any).
+        """
+        if (len(self._fPending) > 0):
+            pending:bytearray = self._fPending
+            # note that a new collection buffer is used, as the existing one cannot be
+            # resized while it is referenced by a memoryview.
+            self._fPending = bytearray()
+            self._EncryptBlocks(memoryview(pending))
 
 
     def flush(self) -> None:
         """
         Overridden.  Calls the same method on the destination stream specified at initialization.
+
+        Any unencrypted data collected by previous writes is encrypted and written to the
+        destination stream first.
         """
+        self._EncryptPending()
         self._fStream.flush()
 
 
@@ -88,41 +165,114 @@ class SICryptoStreamWriter(BytesIO):
         data to fill a block, then it is written to a temporary buffer to be processed 
         on the next write or close.
         """
-        datalen:int = len(data)
-        remaining:int = datalen
-        dataptr:int = 0
-        block_size:int = self._fCipher.block_size
+        mv:memoryview = data if isinstance(data, memoryview) else memoryview(data)
+        return self.WriteFrom(mv, 0, mv.nbytes)
 
-        # process data until there is none left to process.
-        while (remaining > 0):
 
-            # are we about to overflow the buffer?
-            if (self._fBufferPos > (block_size - 1)):
+    def WriteFrom(self, src, offset:int, length:int) -> int:
+        """
+        Write encrypted data from a portion of a buffer to the destination stream 
+        specified at initialization.
 
-                # yes - encrypt the buffer contents.
-                # note that there is no need to pad bytes, as we have a full block.
-                dataPlain = self._fBuffer.tobytes()
-                dataEncrypted = self._fCipher.encrypt(dataPlain)
-                #dataEncrypted = self._fCipher.encrypt(self._fBuffer.tobytes())
+        Args:
+            src (object):
+                Buffer (any object that supports the buffer protocol, e.g. bytes, 
+                bytearray or memoryview) that contains the data to write.
+            offset (int):
+                Offset (in bytes) of the first byte in the buffer to write.
+            length (int):
+                Number of bytes to write.
+
+        Returns:
+            The number of bytes written.
+
+        The data is accessed through a memoryview, so it is not copied before it is 
+        encrypted.  See the write method for more information.
+        """
+        mv:memoryview = src if isinstance(src, memoryview) else memoryview(src)
+        if (mv.format != 'B'):
+            mv = mv.cast('B')
+        mv = mv[offset:offset + length]
+        datalen:int = len(mv)
+
+        # CTR mode does not need block alignment; just encrypt the data as-is.
+        if (not self._fBlockAligned):
+            self._fStream.write(self._fCipher.encrypt(mv))
+            return datalen
+
+        # collect small writes until there is enough data to encrypt in one batch.
+        pending:bytearray = self._fPending
+        if ((len(pending) + datalen) < SICryptoStreamWriter.BATCH_SIZE):
+            pending += mv
+            return datalen
+
+        # encrypt the collected data, followed by the data of this write.
+        self._EncryptPending()
+        self._EncryptBlocks(mv)
 
-                # write encrypted data to the log file stream.
-                encbyteswritten:int = self._fStream.write(dataEncrypted)
+        # indicate we processed all bytes supplied.
+        return datalen
 
-                # reset buffer position.
-                self._fBufferPos = 0
 
-            else:
+    def _EncryptBlocks(self, mv:memoryview) -> None:
+        """
+        Encrypts all full blocks of data, and writes the encrypted data to the 
+        destination stream.
 
-                # no - write a byte to the buffer.
-                self._fBuffer[self._fBufferPos] = data[dataptr]
+        Args:
+            mv (memoryview):
+                Data to encrypt.
 
-                # update pointers for next byte.
-                self._fBufferPos = self._fBufferPos + 1
-                dataptr = dataptr + 1
-                remaining = remaining - 1
+        If there is not enough data to fill a block, then it is written to the 
+        temporary block buffer to be processed on the next write or close.
+        """
+        datalen:int = len(mv)
+
+        # note that instance attributes used more than once are bound to locals.
+        cipher = self._fCipher
+        buffer:memoryview = self._fBuffer
+        block_size:int = cipher.block_size
+        bufferPos:int = self._fBufferPos
+
+        # will all of the data fit in the buffer?  if so, then just buffer it.
+        # note that a full buffer is not encrypted until more data arrives (or the
+        # stream is closed), as the last block is padded by the close method.
+        if ((bufferPos + datalen) <= block_size):
+            buffer[bufferPos:bufferPos + datalen] = mv
+            self._fBufferPos = bufferPos + datalen
+            return
 
-        # indicate we processed all bytes supplied.
-        return datalen
+        # top off the buffer to a full block.
+        dataptr:int = block_size - bufferPos
+        buffer[bufferPos:block_size] = mv[0:dataptr]
+
+        # the remaining data is at least 1 byte; keep the last 1 to block_size bytes
+        # for the buffer, and encrypt the full buffer plus all full blocks before that.
+        # note that there is no need to pad bytes, as we have full blocks.
+        remaining:int = datalen - dataptr
+        tailLen:int = remaining % block_size or block_size
+        alignedLen:int = remaining - tailLen
+        encryptedLen:int = block_size + alignedLen
+
+        # make sure the output buffer is large enough for the encrypted data.
+        # note that a new buffer is allocated (instead of resizing the existing one),
+        # in case the destination stream is still referencing the existing one.
+        if (encryptedLen > len(self._fOutBuffer)):
+            self._fOutBuffer = bytearray(encryptedLen)
+
+        # encrypt directly from the block buffer and the data into the output buffer; 
+        # the cipher chains the blocks across both calls, and the encrypted data is 
+        # written to the destination stream with a single write.
+        out:memoryview = memoryview(self._fOutBuffer)
+        cipher.encrypt(buffer, output=out[0:block_size])
+        if (alignedLen > 0):
+            cipher.encrypt(mv[dataptr:dataptr + alignedLen], output=out[block_size:encryptedLen])
+            dataptr = dataptr + alignedLen
+        self._fStream.write(out[0:encryptedLen])
+
+        # copy the trailing bytes to the buffer.
+        buffer[0:tailLen] = mv[dataptr:datalen]
+        self._fBufferPos = tailLen
 
 
     def close(self) -> None:
@@ -132,39 +282,57 @@ class SICryptoStreamWriter(BytesIO):
         Prior to closing the destination stream, it will encrypt and write out any remaining 
         bytes in the temporary buffer to the destination stream.
         """
+        stream = self._fStream
+
+        # if the destination stream was already closed then we are done.
+        if (stream.closed):
+            return
+
         # if destination stream is not writable then don't bother!
-        if (not self._fStream.writable()):
+        if (not stream.writable()):
             return
 
+        # encrypt any collected data.
+        self._EncryptPending()
+        bufferPos:int = self._fBufferPos
+
         # anything left in the buffer to write?
-        if (self._fBufferPos > 0):
+        if (bufferPos > 0):
 
-            # yes - get the remaining bytes.
-            dataPlain = self._fBuffer.tobytes()[0:self._fBufferPos]
+            # yes - get the remaining bytes (without copying them).
+            buffer:memoryview = self._fBuffer
+            dataPlain:memoryview = buffer[0:bufferPos]
+            block_size:int = self._fCipher.block_size
 
             # do we need to pad data?
-            if (self._fBufferPos < AES.block_size):
-                dataPlainPadded = pad(dataPlain, AES.block_size, self._fPadMethod)
-                dataEncrypted = self._fCipher.encrypt(dataPlainPadded)
+            # pkcs7 padding (the default) is done in place in the buffer; the other
+            # padding methods need a bytes copy, as pad() appends the pad bytes.
+            if (bufferPos < block_size):
+                if (self._fPadMethod == 'pkcs7'):
+                    padLen:int = block_size - bufferPos
+                    buffer[bufferPos:block_size] = bytes((padLen,)) * padLen
+                    dataEncrypted = self._fCipher.encrypt(buffer)
+                else:
+                    dataPlainPadded = pad(bytes(dataPlain), block_size, self._fPadMethod)
+                    dataEncrypted = self._fCipher.encrypt(dataPlainPadded)
             else:
                 dataEncrypted = self._fCipher.encrypt(dataPlain)
-            #dataEncrypted = self._fCipher.encrypt(pad(self._fBuffer.tobytes(), AES.block_size, self._fPadMethod))
 
             # write encrypted data to the log file stream.
-            encbyteswritten:int = self._fStream.write(dataEncrypted)
+            stream.write(dataEncrypted)
 
             # also force a flush since we are closing the stream!
-            self._fStream.flush()
+            stream.flush()
 
             # reset buffer position.
             self._fBufferPos = 0
 
         # close the log file stream.
-        self._fStream.close()
+        stream.close()
 
 
     # we don't care about implementing the following methods, since this should be
-    # a BuffereWriter stream we are inheriting from.
+    # a write-only stream.
 
     #@property
     #def name(self) -> str:
@@ -28,6 +28,9 @@ class SIEnumComparable(Enum):
             other (object):
                 Object to compare with this object.
         """
+        if (other.__class__ is self.__class__):  # same enum type; compare the raw values.
+            return self._value_ > other._value_
+
         try:
             return self.value > other.value     # try to compare the values first.
         except:
@@ -48,6 +51,9 @@ class SIEnumComparable(Enum):
             other (object):
                 Object to compare with this object.
         """
+        if (other.__class__ is self.__class__):  # same enum type; compare the raw values.
+            return self._value_ < other._value_
+
         try:
             return self.value < other.value
         except:
@@ -68,6 +74,9 @@ class SIEnumComparable(Enum):
             other (object):
                 Object to compare with this object.
         """
+        if (other.__class__ is self.__class__):  # same enum type; compare the raw values.
+            return self._value_ >= other._value_
+
         try:
             return self.value >= other.value
         except:
@@ -90,6 +99,9 @@ class SIEnumComparable(Enum):
             other (object):
                 Object to compare with this object.
         """
+        if (other.__class__ is self.__class__):  # same enum type; compare the raw values.
+            return self._value_ <= other._value_
+
         try:
             return self.value <= other.value
         except:
@@ -112,9 +124,12 @@ class SIEnumComparable(Enum):
             other (object):
                 Object to compare with this object.
         """
-        if (other == None):
+        if (other is None):
             return False
 
+        if (other.__class__ is self.__class__):  # same enum type; compare the raw values.
+            return self._value_ == other._value_
+
         try:
             return self.value == other.value
         except:
@@ -19,6 +19,8 @@ class SIErrorEventArgs:
         This class is fully thread-safe.
     """
 
+    __slots__ = ("_fException", "_fMessage")
+
     def __init__(self, e:Exception) -> None:
         """
         Initializes a new instance of the class.
@@ -30,6 +32,7 @@ class SIErrorEventArgs:
 
         # initialize instance.
         self._fException:Exception = e
+        self._fMessage:str = None          # string representation; built on first reference.
 
 
     @property
@@ -47,12 +50,18 @@ class SIErrorEventArgs:
         Returns:
             A string in the form of "SIErrorEventArgs: Exception Message".
         """
-        exMsg:str = UNKNOWN_VALUE
+        # the exception message is only converted once, as the same event arguments
+        # are passed to every event handler.
+        if (self._fMessage is None):
+
+            exMsg:str = UNKNOWN_VALUE
+
+            if (self._fException is not None):
+                exMsg = str(self._fException)
 
-        if (self._fException != None):
-            exMsg = str(self._fException)
+            self._fMessage = "SIErrorEventArgs: " + exMsg
 
-        return "SIErrorEventArgs: {0}".format(exMsg)
+        return self._fMessage
 
 
 @export
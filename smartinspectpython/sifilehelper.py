@@ -1,7 +1,9 @@
 # system imports.
 from datetime import datetime
+import functools
 import glob
 import os
+import re
 
 # our package imports.
 from .smartinspectexception import SmartInspectException
@@ -33,6 +35,9 @@ class SIFileHelper:
     DATETIME_SEPARATOR:chr = '-'
     DATETIME_TOKENS:int = 6
 
+    _DATETIME_PATTERN:re.Pattern = re.compile(r'(\d+)-(\d+)-(\d+)-(\d+)-(\d+)-(\d+)')
+    """ Matches the DATETIME_TOKENS digit groups of a timestamp (e.g. "2023-05-22-00-49-55"). """
+
 
     @staticmethod
     def _ExpandFileName(baseName:str) -> str:
@@ -165,6 +170,7 @@ class SIFileHelper:
 
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def _TryGetFileDate(baseName:str, path:str) -> bool:
         """ 
         Trys to return a datetime object of the timestamp portion of the filename path argument.
@@ -180,6 +186,9 @@ class SIFileHelper:
                 True if the timestamp portion of the filename path argument could be converted to a datetime object.
             fileDate
                 The datetime object of the timestamp portion of the filename path argument.  Value is not valid if the return value is False.
+
+        Results are cached, as the same log file names are checked each time the
+        log files are enumerated (e.g. when rotating).
         """
         fileDate:datetime = datetime.min # DateTime.MinValue; # Required
 
@@ -210,7 +219,7 @@ class SIFileHelper:
         # not override an existing file.
 
         if (len(value) > SIFileHelper.DATETIME_FORMAT_LEN):
-            value = value.Substring(0, SIFileHelper.DATETIME_FORMAT_LEN)
+            value = value[:SIFileHelper.DATETIME_FORMAT_LEN]
 
         # try to create a datetime object from the file timestamp.
         fileDate:datetime
@@ -246,31 +255,22 @@ class SIFileHelper:
         if (len(fileDate) != SIFileHelper.DATETIME_FORMAT_LEN):
             return False, None
 
-        # ensure value is all digits and separator characters.
-        for i in range(len(fileDate)):
-        
-            c:str = fileDate[i]
-            if ((not c.isdigit()) and (c != SIFileHelper.DATETIME_SEPARATOR)):
-                return False, None
-            
-        # create an array of timestamp values, delimited by separator character.
-        # e.g. [2023,05,22,00,49,55]
-        values = fileDate.split(SIFileHelper.DATETIME_SEPARATOR)
-
-        # if we don't have the exact number of tokens then it's an invalid timestamp - don't bother.
-        if ((values == None) or (len(values) != SIFileHelper.DATETIME_TOKENS)):
+        # ensure value is all digits and separator characters, with the exact
+        # number of tokens (e.g. [2023,05,22,00,49,55]); if not, then don't bother.
+        values = SIFileHelper._DATETIME_PATTERN.fullmatch(fileDate)
+        if (values == None):
             return False, None
 
         try:
         
             # create new date based upon array timestamp values.
             dateTime = datetime(
-                int(values[0]), # Year
-                int(values[1]), # Month
-                int(values[2]), # Day
-                int(values[3]), # Hour
-                int(values[4]), # Minute
-                int(values[5])  # Second
+                int(values[1]), # Year
+                int(values[2]), # Month
+                int(values[3]), # Day
+                int(values[4]), # Hour
+                int(values[5]), # Minute
+                int(values[6])  # Second
             )
         
         except Exception as ex:
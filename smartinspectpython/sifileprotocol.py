@@ -1,8 +1,9 @@
-from Crypto.Hash import MD5
 from Crypto.Cipher import AES
 from datetime import datetime
 from io import BytesIO, BufferedWriter
 import os
+import re
+import time
 
 # our package imports.
 from .sibinaryformatter import SIBinaryFormatter
@@ -15,7 +16,6 @@ from .siformatter import SIFormatter
 from .sipacket import SIPacket
 from .siprotocol import SIProtocol
 from .siprotocolexception import SIProtocolException
-from .siutils import DateHelper
 from .smartinspectexception import SmartInspectException
 
 # auto-generate the "__all__" variable with classes decorated with "@export".
@@ -43,15 +43,22 @@ class SIFileProtocol(SIProtocol):
         The public members of this class are thread-safe.
     """
     
-    _DEFAULT_BUFFER:int = 0x2000     # 8kb buffer if custom buffering not specified.
+    _DEFAULT_BUFFER:int = 0x10000    # 64kb buffer if custom buffering not specified.
     _KEY_SIZE:int = 16               # 16 byte / 128 bit key size for AES encryption
     _BLOCK_SIZE:int = 16             # 16 byte / 128 bit block size for AES encryption
+    _ROTATE_CHECK_INTERVAL:int = 3600  # seconds between rotate checks; all rotate modes start a new period on a UTC hour boundary.
 
-    _SILF:bytearray = SIBinaryFormatter._EncodeStringAscii("SILF")
-    """ The SI Log File eye-cactcher identifier of "SILF" in an ASCII encoded bytearray form. """
+    _FILENAME_PARAMS:re.Pattern = re.compile(r'%appname%|%machinename%')
+    """ Matches the "%appname%" and "%machinename%" parameters of a log file name. """
 
-    _SILE:bytearray = SIBinaryFormatter._EncodeStringAscii("SILE")
-    """ The SI Encrypted Log File eye-cactcher identifier of "SILE" in an ASCII encoded bytearray form. """
+    _VALID_OPTIONS:frozenset = frozenset(("append", "buffer", "encrypt", "filename", "flushonwrite", "key", "maxsize", "maxparts", "rotate"))
+    """ Option names supported by this protocol (see IsValidOption). """
+
+    _SILF:bytes = b"SILF"
+    """ The SI Log File eye-cactcher identifier of "SILF" in an ASCII encoded bytes form. """
+
+    _SILE:bytes = b"SILE"
+    """ The SI Encrypted Log File eye-cactcher identifier of "SILE" in an ASCII encoded bytes form. """
 
 
     def __init__(self) -> None:
@@ -63,12 +70,15 @@ class SIFileProtocol(SIProtocol):
         super().__init__()
 
         # initialize instance.
-        self._fStream:BytesIO = BytesIO()
+        self._fStream:BytesIO = None
         self._fFormatter:SIFormatter = None
+        self._fPacketFormatter:SIFormatter = None  # Formatter property value, cached on connect for InternalWritePacket.
         self._fRotater:SIFileRotater = SIFileRotater()
         self._fRotate:SIFileRotate = SIFileRotate.NoRotate
+        self._fRotateCheckTime:float = 0.0  # time (in seconds since the epoch) of the next rotate check.
         self._fIOBuffer:int = 0
         self._fIOBufferCounter:int = 0
+        self._fFlushOnWrite:bool = True
         self._fFileName:str = "log.sil"
         self._fFileSize:int = 0
         self._fEncrypt:bool = False
@@ -131,21 +141,26 @@ class SIFileProtocol(SIProtocol):
         Returns:
             A new encrypted stream.
         """
-        # get MD5 initialization vector for AES cryptographic functions.
+        # get a random initialization vector for AES cryptographic functions.
         iv = SIFileProtocol.GetIVector()
 
         # add the encryption header ("SILE" eye-catcher + AES initialization vector).
         # note that the data that FOLLOWS the header will be encrypted, but the header itself is not encrypted.
-        stream.write(SIFileProtocol._SILE)
-        stream.write(iv)
+        stream.write(SIFileProtocol._SILE + iv)
         stream.flush()
 
         # create the AES cipher using Ciphertext Block Chaining (CBC) mode.
+        # note that the hardware AES instructions (AES-NI) are requested explicitly; 
+        # PyCryptodome falls back to its portable implementation if the CPU does not 
+        # support them.
         AES.block_size = SIFileProtocol._BLOCK_SIZE
-        cipher = AES.new(self._fKey, AES.MODE_CBC, iv)
+        cipher = AES.new(self._fKey, AES.MODE_CBC, iv, use_aesni=True)
 
-        # wrap the passed stream.
-        return SICryptoStreamWriter(stream, cipher, 'pkcs7')
+        # wrap the passed (unbuffered) stream in the log file buffer, and encrypt into it.
+        # note that the buffer is supplied here so that the crypto stream does not add a
+        # buffer of its own; it is the only buffer between the encrypted data and the file.
+        ioBufferSize:int = self._fIOBuffer if (self._fIOBuffer > 0) else SIFileProtocol._DEFAULT_BUFFER
+        return SICryptoStreamWriter(BufferedWriter(stream, ioBufferSize), cipher, 'pkcs7')
 
 
     def _InternalAfterConnect(self, fileName:str) -> None:
@@ -171,6 +186,7 @@ class SIFileProtocol(SIProtocol):
             fileDate:datetime = SIFileHelper.GetFileDate(self._fFileName, fileName)
 
             self._fRotater.Initialize(fileDate)
+            self._fRotateCheckTime = 0.0  # check on the next packet.
 
         if (self._fMaxParts == 0):  # Unlimited log files
             return
@@ -217,9 +233,12 @@ class SIFileProtocol(SIProtocol):
         # validate encryption keys (if used).
         self._InternalBeforeConnect()
 
-        # replace filename parameters.
-        self._fFileName = self._fFileName.replace("%appname%", self.AppName)
-        self._fFileName = self._fFileName.replace("%machinename%", self.HostName)
+        # replace filename parameters (in a single pass).
+        # note that the parameters are only present on the first connect, as the 
+        # replaced file name is stored for subsequent connects (e.g. rotations).
+        if ("%" in self._fFileName):
+            params:dict = {"%appname%": self.AppName, "%machinename%": self.HostName}
+            self._fFileName = SIFileProtocol._FILENAME_PARAMS.sub(lambda match: params[match.group(0)], self._fFileName)
 
         # create destination directory if necessary (e.g. "C:\\logs").
         dirName:str = os.path.dirname(self._fFileName)
@@ -244,7 +263,9 @@ class SIFileProtocol(SIProtocol):
         try:
 
             # open the log file.
-            self._fStream = open(fileName, fileFlags)
+            # note that the file is opened unbuffered, as a single buffer is added
+            # below: on top of the file, or underneath the encryption stream.
+            self._fStream = open(fileName, fileFlags, buffering=0)
 
         except Exception as ex:
 
@@ -265,16 +286,23 @@ class SIFileProtocol(SIProtocol):
 
         # was a custom buffer size selected?
         # if so, then allocate the buffer and reset the buffer counter.
-        # if not, then just allocate a single buffer of 8192 bytes.
+        # if not, then just allocate a single buffer of 65536 bytes.
+        # note that an encrypted stream is not wrapped in a buffer, as it collects the
+        # data to encrypt itself; flushing a buffer on top of it would not flush (and
+        # encrypt) the collected data.
         if (self._fIOBuffer > 0):
         
-            self._fStream = BufferedWriter(self._fStream, self._fIOBuffer)
+            if (not self._fEncrypt):
+                self._fStream = BufferedWriter(self._fStream, self._fIOBuffer)
             self._fIOBufferCounter = 0     # reset buffer counter
         
-        else:
+        elif (not self._fEncrypt):
         
             self._fStream = BufferedWriter(self._fStream, SIFileProtocol._DEFAULT_BUFFER)
-            pass
+
+        # cache the formatter used to write packets, so that InternalWritePacket
+        # does not have to go through the Formatter property for every packet.
+        self._fPacketFormatter = self.Formatter
 
         self._InternalAfterConnect(fileName)
 
@@ -313,6 +341,7 @@ class SIFileProtocol(SIProtocol):
         builder.AddOptionBool("append", self._fAppend)
         builder.AddOptionInteger("buffer", self._fIOBuffer / 1024)
         builder.AddOptionString("filename", self._fFileName)
+        builder.AddOptionBool("flushonwrite", self._fFlushOnWrite)
         builder.AddOptionInteger("maxsize", self._fMaxSize / 1024)
         builder.AddOptionInteger("maxparts", self._fMaxParts)
         builder.AddOptionFileRotate("rotate", self._fRotate)
@@ -323,17 +352,18 @@ class SIFileProtocol(SIProtocol):
     @staticmethod
     def GetIVector() -> bytes:
         """
-        Returns a new MD5 hashed initialization vector for AES cryptographic functions.
-        The vector is based on a current datetime ticks value.
+        Returns a new random initialization vector for AES cryptographic functions.
 
         Returns:
-            A new MD5 hashed initialization vector of 16 bytes (128-bits).</returns>
+            A new initialization vector of 16 bytes (128-bits).
+
+        The vector is generated by the operating system random number generator 
+        (os.urandom).  A vector based on the current time would be
+        predictable, which weakens the CBC encryption of the log file.  The vector 
+        is stored unencrypted in the log file header, so readers of the log file 
+        are not affected by how it is generated.
         """
-        ticks:int = DateHelper.Ticks(datetime.now())
-        resultHash = MD5.new()
-        resultHash.block_size = SIFileProtocol._BLOCK_SIZE
-        resultHash.update(SIBinaryFormatter._EncodeString(str(ticks)))
-        return resultHash.digest()
+        return os.urandom(SIFileProtocol._BLOCK_SIZE)
 
 
     def GetStream(self, stream:BytesIO) -> None:
@@ -386,11 +416,11 @@ class SIFileProtocol(SIProtocol):
         This method closes the underlying file handle if previously
         created and disposes any supplemental objects.
         """
-        if (self._fStream.writable or self._fStream.readable):
+        if (self._fStream is not None):
         
             self.WriteFooter(self._fStream)
             self._fStream.close()
-            #self._fStream.Dispose()
+            self._fStream = None
 
 
     def InternalWritePacket(self, packet:SIPacket) -> None:
@@ -412,39 +442,93 @@ class SIFileProtocol(SIProtocol):
         is rotated if necessary. Please see the documentation of the
         IsValidOption method for more information.
         """
-        formatter:SIFormatter = self.Formatter
+        self._WritePacket(packet)
+
+        # write the packet to disk now, unless I/O buffering is enabled.
+        if ((self._fIOBuffer == 0) and (self._fFlushOnWrite)):
+            self._fStream.flush()
+
+
+    def InternalWritePackets(self, packets:list) -> None:
+        """
+        Overridden. Writes a batch of packets to the destination file.
+
+        Args:
+            packets (list):
+                List of SIPacket objects to write, in the order they were logged.
+
+        Raises:
+            Exception:
+                Writing a packet to the destination file failed.
+
+        The packets are rotated and buffered the same as they are by the
+        InternalWritePacket method, except that the destination file is only
+        flushed once after the last packet of the batch has been written.
+        """
+        for packet in packets:
+            self._WritePacket(packet)
+
+        # write the packets to disk now, unless I/O buffering is enabled.
+        if ((self._fIOBuffer == 0) and (self._fFlushOnWrite)):
+            self._fStream.flush()
+
+
+    def _WritePacket(self, packet:SIPacket) -> None:
+        """
+        Writes a packet to the destination file, rotating the file first if 
+        necessary.
+
+        Args:
+            packet (SIPacket):
+                The packet to write.
+
+        The destination file is only flushed here if the "buffer" option is
+        set and the I/O buffer is full; the callers handle the flush for the 
+        unbuffered case.
+        """
+        # note that instance attributes used more than once are bound to locals.
+        formatter:SIFormatter = self._fPacketFormatter
         packetSize:int = formatter.Compile(packet)
+        maxSize:int = self._fMaxSize
+        ioBuffer:int = self._fIOBuffer
 
         # if we are rotating logs and the rotation state has changed,
         # then call the Rotate method to open a new log file rotation.
+        # note that the rotation state can only change on a UTC hour boundary,
+        # so the rotater is only updated for the first packet of each hour.
         if (self._fRotate != SIFileRotate.NoRotate):
-            if (self._fRotater.Update(datetime.utcnow())):
-                self._Rotate()
-
-        if (self._fMaxSize > 0):
+            nowTime:float = time.time()
+            if (nowTime >= self._fRotateCheckTime):
+                interval:int = SIFileProtocol._ROTATE_CHECK_INTERVAL
+                self._fRotateCheckTime = ((nowTime // interval) + 1) * interval
+                if (self._fRotater.Update(datetime.utcfromtimestamp(nowTime))):
+                    self._Rotate()
+
+        if (maxSize > 0):
         
             self._fFileSize += packetSize;
-            if (self._fFileSize > self._fMaxSize):
+            if (self._fFileSize > maxSize):
             
                 self._Rotate()
 
-                if (packetSize > self._fMaxSize):
+                if (packetSize > maxSize):
                     return
 
                 self._fFileSize += packetSize
 
-        formatter.Write(self._fStream)
+        # note that the stream is bound after rotating, as rotating opens a new stream.
+        stream:BytesIO = self._fStream
+        formatter.Write(stream)
 
-        if (self._fIOBuffer > 0):
+        if (ioBuffer > 0):
         
-            self._fIOBufferCounter = self._fIOBufferCounter + packetSize
-            if (self._fIOBufferCounter > self._fIOBuffer):
+            ioBufferCounter:int = self._fIOBufferCounter + packetSize
+            if (ioBufferCounter > ioBuffer):
             
-                self._fIOBufferCounter = 0
-                self._fStream.flush()
-        else:
-        
-            self._fStream.flush()
+                ioBufferCounter = 0
+                stream.flush()
+
+            self._fIOBufferCounter = ioBufferCounter
         
 
     def IsValidOption(self, name:str) -> bool:
@@ -467,6 +551,7 @@ class SIFileProtocol(SIProtocol):
         |buffer (0)                     | Specifies the I/O buffer size in kilobytes. It is possible to specify size units like this: "1 MB". Supported units are "KB", "MB" and "GB". A value of 0 disables this feature. Enabling the I/O buffering greatly improves the logging performance but has the disadvantage that log packets are temporarily stored in memory and are not immediately written to disk.
         |encrypt (false)                | Specifies if the resulting log file should be encrypted. Note that the 'append' option cannot be used with encryption enabled. If encryption is enabled the 'append' option has no effect.
         |filename ([varies])            | Specifies the filename of the log.
+        |flushonwrite (true)            | Specifies if each packet should be written to disk immediately when I/O buffering is disabled (buffer=0). Setting this to false lets the stream collect packets in a 64 KB buffer and write them to disk when it is full, which avoids a disk write per packet; packets that are not yet written are written when the protocol disconnects. Encrypted log files are written in batches of SICryptoStreamWriter.BATCH_SIZE (8 KB) bytes when this is false, with the underlying file buffer size set by the 'buffer' option (or 64 KB if it is 0).
         |key ([empty])                  | Specifies the secret encryption key as string if the 'encrypt' option is enabled.
         |maxparts ([varies])            | Specifies the maximum amount of log files at any given time when log rotating is enabled or the maxsize option is set. Specify 0 for no limit. See below for information on the default value for this option.
         |maxsize (0)                    | Specifies the maximum size of a log file in kilobytes. When this size is reached, the current log file is closed and a new file is opened. The maximum amount of log files can be set with the maxparts option. It is possible to specify size units like this: "1 MB". Supported units are "KB", "MB" and "GB".  A value of 0 disables this feature.
@@ -511,14 +596,7 @@ class SIFileProtocol(SIProtocol):
         </details>
         """
         return \
-            (name == "append") or \
-            (name == "buffer") or \
-            (name == "encrypt") or \
-            (name == "filename") or \
-            (name == "key") or \
-            (name == "maxsize") or \
-            (name == "maxparts") or \
-            (name == "rotate") or \
+            (name in SIFileProtocol._VALID_OPTIONS) or \
             (super().IsValidOption(name))
 
 
@@ -537,6 +615,7 @@ class SIFileProtocol(SIProtocol):
         self._fFileName = self.GetStringOption("filename", self.DefaultFileName)
         self._fAppend = self.GetBooleanOption("append", False)
         self._fIOBuffer = self.GetSizeOption("buffer", 0)
+        self._fFlushOnWrite = self.GetBooleanOption("flushonwrite", True)
         self._fRotate = self.GetRotateOption("rotate", SIFileRotate.NoRotate)
         self._fMaxSize = self.GetSizeOption("maxsize", 0)
 
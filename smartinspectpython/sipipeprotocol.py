@@ -56,6 +56,8 @@ class SIPipeProtocol(SIProtocol):
         self._fPipeHandle:SIPipeHandle = None
         self._fStream:SIPipeStream = None
         self._fFormatter:SIBinaryFormatter = SIBinaryFormatter()
+        self._fIOBuffer:int = 0
+        self._fIOBufferCounter:int = 0
 
         # set default options.
         self.LoadOptions()
@@ -115,6 +117,7 @@ class SIPipeProtocol(SIProtocol):
 
         # build options specific to our class.
         builder.AddOptionString("pipename", self._fPipeName)
+        builder.AddOptionInteger("buffer", self._fIOBuffer // 1024)
 
 
     def InternalConnect(self) -> None:
@@ -137,6 +140,7 @@ class SIPipeProtocol(SIProtocol):
         # open the named pipe and create the stream to read from / write to.
         self._fPipeHandle:SIPipeHandle = SIPipeHandle(self._fPipeName)
         self._fStream = SIPipeStream(self._fPipeHandle.Handle)
+        self._fIOBufferCounter = 0
 
         # exchange banners with the console server.
         self._DoHandShake(self._fStream)
@@ -158,7 +162,13 @@ class SIPipeProtocol(SIProtocol):
         """
         if (self._fStream != None):
             if (self._fStream.writable() or self._fStream.readable()):
-                self._fStream.close()
+                try:
+                    # send any buffered packets before closing the pipe.
+                    if (self._fIOBufferCounter > 0):
+                        self._fIOBufferCounter = 0
+                        self._fStream.flush()
+                finally:
+                    self._fStream.close()
 
 
     def InternalReconnect(self) -> bool:
@@ -192,10 +202,25 @@ class SIPipeProtocol(SIProtocol):
 
         This method sends the supplied packet to the SmartInspect
         Console over the previously established named pipe connection.
+        If the "buffer" option is set, then packets are collected in the
+        stream buffer and written to the pipe with a single call once the
+        buffer size is exceeded or the connection is closed.
         """
         if (not self._fStream.writable):
             raise SmartInspectException("Underlying connection stream is no longer writeable, which indicates the connection no longer exists.")
 
+        # was a custom buffer size selected?
+        # if so, then only write to the pipe once the buffer size is exceeded.
+        if (self._fIOBuffer > 0):
+
+            packetSize:int = self._fFormatter.Compile(packet)
+            self._fFormatter.Write(self._fStream)
+            self._fIOBufferCounter = self._fIOBufferCounter + packetSize
+            if (self._fIOBufferCounter > self._fIOBuffer):
+                self._fIOBufferCounter = 0
+                self._fStream.flush()
+            return
+
         self._fFormatter.Format(packet, self._fStream)
         self._fStream.flush()
 
@@ -217,6 +242,7 @@ class SIPipeProtocol(SIProtocol):
         Valid Options (default value)  | Description
         -----------------------------  | -------------------------------------------------
         - pipename ("smartinspect")    | Specifies the named pipe for sending log packets to the SmartInspect Console.  This value must match the pipe name in the SmartInspect Console options.
+        - buffer (0)                   | Specifies the packet buffer size in kilobytes; supports byte units (e.g. "32KB").  A value of 0 disables this feature.  Enabling the buffer writes packets to the named pipe in batches, which greatly improves the logging performance but has the disadvantage that log packets are temporarily stored in memory and are not immediately sent to the Console.
 
         <details>
             <summary>Sample Code</summary>
@@ -227,6 +253,7 @@ class SIPipeProtocol(SIProtocol):
         """
         return \
             (name == "pipename") or \
+            (name == "buffer") or \
             (super().IsValidOption(name))
 
 
@@ -243,3 +270,4 @@ class SIPipeProtocol(SIProtocol):
 
         # load options specific to our class.
         self._fPipeName = self.GetStringOption("pipename", "smartinspect");
+        self._fIOBuffer = self.GetSizeOption("buffer", 0)
@@ -264,16 +264,26 @@ class SIProtocol:
 
     def _FlushQueue(self) -> None:
         """
+        Writes all packets of the backlog queue to the protocol destination.
+
+        The packets are passed to the InternalWritePackets method in a single 
+        call, so that protocols can write them as one batch.
         """
+        packets:list = []
         packet:SIPacket = self._fQueue.Pop()
 
         while (packet != None):
-            self._ForwardPacket(packet, False)
+            packets.append(packet)
             packet = self._fQueue.Pop()
 
+        if (len(packets) > 0):
+            self._ForwardPackets(packets)
 
-    def _ForwardPacket(self, packet:SIPacket, disconnect:bool) -> None:
+
+    def _ForwardConnect(self) -> None:
         """
+        Connects (or reconnects) to the protocol destination before packets 
+        are forwarded, if not already connected.
         """
         if (not self._fConnected):
 
@@ -284,6 +294,12 @@ class SIProtocol:
             else:
                 self._Reconnect()
 
+
+    def _ForwardPacket(self, packet:SIPacket, disconnect:bool) -> None:
+        """
+        """
+        self._ForwardConnect()
+
         if (self._fConnected):
 
             packet.Lock()
@@ -301,6 +317,31 @@ class SIProtocol:
                 self.InternalDisconnect()
 
 
+    def _ForwardPackets(self, packets:list) -> None:
+        """
+        Writes a batch of packets to the protocol destination.
+
+        Args:
+            packets (list):
+                List of SIPacket objects to write.
+        """
+        self._ForwardConnect()
+
+        if (self._fConnected):
+
+            for packet in packets:
+                packet.Lock()
+
+            try:
+
+                self.InternalWritePackets(packets)
+
+            finally:
+
+                for packet in packets:
+                    packet.Unlock()
+
+
     def _GetOptions(self) -> str:
         """
         Returns a string of options used by this protocol.
@@ -465,6 +506,10 @@ class SIProtocol:
         This method is used to inform other objects that an exception was caught for 
         a protocol function.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.ErrorEvent.hasHandlers()):
+            return
+
         try:
 
             args:SIErrorEventArgs = SIErrorEventArgs(ex)
@@ -1254,6 +1299,28 @@ class SIProtocol:
         pass
 
 
+    def InternalWritePackets(self, packets:list) -> None:
+        """
+        Writes a batch of packets to the protocol destination.
+
+        Args:
+            packets (list):
+                List of SIPacket objects to write, in the order they were logged.
+
+        Raises:
+            Exception:
+                Writing a packet to the destination failed.
+
+        This method is called when the backlog queue is flushed.  The default 
+        implementation calls InternalWritePacket for each packet.  Real protocol 
+        implementations can override this method to write the packets more 
+        efficiently (e.g. with a single flush of the destination).  This method 
+        is always called in a thread-safe and exception-safe context.
+        """
+        for packet in packets:
+            self.InternalWritePacket(packet)
+
+
     def IsValidOption(self, name:str) -> bool:
         """
         Overriddeable. Validates if a option is supported by this protocol.
@@ -1477,6 +1544,10 @@ class SIProtocol:
         This method is used to inform other objects that an informational message was
         issued by a protocol function.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.InfoEvent.hasHandlers()):
+            return
+
         try:
 
             args:SIInfoEventArgs = SIInfoEventArgs(message)
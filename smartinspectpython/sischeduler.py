@@ -157,10 +157,14 @@ class SIScheduler:
                     self._fMonitorCondition.wait()
 
             # add the command to the queue.
+            wasEmpty:bool = (self._fQueue.Count == 0)
             self._fQueue.Enqueue(command)
 
             # signal the scheduler threadtask that we added an item to the queue.
-            self._fMonitorCondition.notify_all()
+            # the threadtask only waits while the queue is empty, so there is no
+            # need to wake it up if the queue already contained commands.
+            if (wasEmpty):
+                self._fMonitorCondition.notify_all()
 
         return True
 
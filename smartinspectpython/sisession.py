@@ -83,6 +83,12 @@ class SISession:
         This class is fully thread-safe.
     """
 
+    _HEX_BYTE:tuple = tuple(" (0x{0:X})".format(i) for i in range(256))
+    """ Precomputed hexadecimal representations (e.g. " (0xFF)") of the byte values 0 - 255. """
+
+    _SQLITE_FETCH_SIZE:int = 1024
+    """ Number of rows fetched at a time from a Sqlite cursor when logging cursor data. """
+
     def __init__(self, parent, name:str) -> None:
         """
         Initializes a new SISession instance with the
@@ -1233,13 +1239,22 @@ class SISession:
         derived class it is recommended to call this method first.
         """
         # use the session level if level not specified on the method call.
-        if (level == None):
+        if (level is None):
             level = self._fParent.DefaultLevel
 
-        return self._fActive and \
-                self._fParent.Enabled and \
-                (level >= self._fLevel) and \
-                (level >= self._fParent.Level)
+        # this is called by every logging method, so compare the raw level values
+        # rather than going through the SIEnumComparable comparison operators.
+        # levels that are not SILevel members (e.g. integers) use the operators.
+        try:
+            return self._fActive and \
+                    self._fParent.Enabled and \
+                    (level._value_ >= self._fLevel._value_) and \
+                    (level._value_ >= self._fParent.Level._value_)
+        except AttributeError:
+            return self._fActive and \
+                    self._fParent.Enabled and \
+                    (level >= self._fLevel) and \
+                    (level >= self._fParent.Level)
 
 
     def LeaveMethod(self, level:SILevel=None, methodName:str=None) -> None:
@@ -1730,10 +1745,13 @@ class SISession:
 
             vhex:str = ""
             if (includeHex):
-                vhex = " (" + hex(value).upper() + ")"
-                if (value < 0):
-                    vhex = vhex.replace("-","")     # remove minus sign for negative values.
-                vhex = vhex.replace("0X","0x")      # make "0X" lower-case since hex values will be in upper-case
+                if (0 <= value <= 255):
+                    vhex = SISession._HEX_BYTE[value]
+                else:
+                    vhex = " (" + hex(value).upper() + ")"
+                    if (value < 0):
+                        vhex = vhex.replace("-","")     # remove minus sign for negative values.
+                    vhex = vhex.replace("0X","0x")      # make "0X" lower-case since hex values will be in upper-case
 
             # send log entry packet.
             title:str = str.format("{0} = {1}{2}", name, str(value), vhex)
@@ -2783,10 +2801,13 @@ class SISession:
 
             vhex:str = ""
             if (includeHex):
-                vhex = " (" + hex(value).upper() + ")"
-                if (value < 0):
-                    vhex = vhex.replace("-","")     # remove minus sign for negative values.
-                vhex = vhex.replace("0X","0x")      # make "0X" lower-case since hex values will be in upper-case
+                if (0 <= value <= 255):
+                    vhex = SISession._HEX_BYTE[value]
+                else:
+                    vhex = " (" + hex(value).upper() + ")"
+                    if (value < 0):
+                        vhex = vhex.replace("-","")     # remove minus sign for negative values.
+                    vhex = vhex.replace("0X","0x")      # make "0X" lower-case since hex values will be in upper-case
 
             # send log entry packet.
             title:str = str.format("{0} = {1}{2}", name, str(value), vhex)
@@ -3403,7 +3424,8 @@ class SISession:
                 Refer to the SIColors enum in the sicolor module for common color values.
                 Specify None to use default background color.
 
-        This method logs all data of the supplied cursor, using a "for row in cursor:" statement.
+        This method logs all data of the supplied cursor, fetching the rows in blocks
+        via the cursor "fetchmany" method.
         Note that this WILL move the position of the cursor, and the position is not restored.
         """
         if (not self.IsOn(level)):
@@ -3441,16 +3463,23 @@ class SISession:
             # write the column header.
             ctx.AppendHeader(sb)
 
-            # write all rows in the cursor.
+            # write all rows in the cursor, fetching them in blocks.
             rowcnt:int = 0
-            for row in cursor:
+            while (True):
 
-                # add column data for the row to the context view.
-                ctx.BeginRow()
-                for i in range(len(columns)):
-                    ctx.AddRowEntry(str(row[i]))
-                ctx.EndRow()
-                rowcnt = rowcnt + 1
+                rows:list = cursor.fetchmany(SISession._SQLITE_FETCH_SIZE)
+                if (not rows):
+                    break
+
+                for row in rows:
+
+                    # add column data for the row to the context view.
+                    ctx.BeginRow()
+                    for value in row:
+                        ctx.AddRowEntry(str(value))
+                    ctx.EndRow()
+
+                rowcnt = rowcnt + len(rows)
 
             # modify the title with the data row count.
             title += " ({0} rows)".format(str(rowcnt))
@@ -3772,6 +3801,108 @@ class SISession:
             self.LogInternalError("{0}: {1}".format(methodName, str(ex)))
 
 
+    def LogSqliteDbSchemaSummary(self, level:SILevel=None, title:str=None, conn:sqlite3.Connection=None, colorValue:SIColors=None) -> None:
+        """
+        Logs a summary of the columns, indexes and foreign keys of all tables defined 
+        in a Sqlite DB with a custom title and custom log level.
+
+        Args:
+            level (SILevel):
+                The log level of this method call.
+            title (str):
+                The title to display in the Console.
+            conn (Connection):
+                Sqlite database connection object.
+            colorValue (SIColors):
+                Background color value (SIColors enum, or ARGB integer form) for the message.
+                Refer to the SIColors enum in the sicolor module for common color values.
+                Specify None to use default background color.
+
+        This method queries the schema information for all tables with a single SQL statement,
+        that joins the "sqlite_schema" table with the "pragma_table_info", "pragma_index_list"
+        and "pragma_foreign_key_list" table-valued functions.  This is more efficient than
+        calling the LogSqliteDbSchemaTableInfo, LogSqliteDbSchemaIndexList and 
+        LogSqliteDbSchemaForeignKeyList methods for each table, and the results are sent
+        in a single packet.  SQLite internal tables (e.g. "sqlite_sequence", "sqlite_stat1") 
+        are not included.
+
+        This will log the following details returned from the schema information query,
+        sorted by table name:
+        - Table, Kind (Column, Foreign Key, Index), ID, Name, Details
+        """
+        if (not self.IsOn(level)):
+            return
+
+        methodName:str = "LogSqliteDbSchemaSummary"
+
+        if (conn == None):
+            self.LogInternalError("{0}: conn argument is null.".format(methodName))
+            return
+
+        # default title if one was not supplied.
+        if (title == None) or (len(title) == 0):
+            title = "Sqlite DB Schema Information: Summary"
+
+        tblSchema:list = None
+
+        try:
+
+            # sql to query db for schema info of all tables.
+            sql:str = "SELECT t.name, 'Column', c.cid, c.name, " \
+                      "c.type || CASE WHEN c.pk THEN ' PRIMARY KEY' ELSE '' END || CASE WHEN c.\"notnull\" THEN ' NOT NULL' ELSE '' END " \
+                      "FROM sqlite_schema t JOIN pragma_table_info(t.name) c WHERE t.type = 'table' AND substr(t.name, 1, 7) <> 'sqlite_' " \
+                      "UNION ALL " \
+                      "SELECT t.name, 'Index', i.seq, i.name, " \
+                      "CASE WHEN i.\"unique\" THEN 'UNIQUE ' ELSE '' END || 'origin=' || i.origin " \
+                      "FROM sqlite_schema t JOIN pragma_index_list(t.name) i WHERE t.type = 'table' AND substr(t.name, 1, 7) <> 'sqlite_' " \
+                      "UNION ALL " \
+                      "SELECT t.name, 'Foreign Key', f.id, f.\"from\", " \
+                      "'REFERENCES ' || f.\"table\" || '(' || IFNULL(f.\"to\", '') || ')' " \
+                      "FROM sqlite_schema t JOIN pragma_foreign_key_list(t.name) f WHERE t.type = 'table' AND substr(t.name, 1, 7) <> 'sqlite_' " \
+                      "ORDER BY 1, 2, 3;"
+
+            # execute sql.
+            cursor:sqlite3.Cursor = conn.execute(sql)
+            tblSchema = cursor.fetchall()
+
+            # results contain information about each table.
+            # table name, kind, id, name, details
+            if ((tblSchema == None) or (len(tblSchema)) == 0):
+                self.LogInternalError("{0}: table list could not be queried.".format(methodName));
+                return;
+
+        except Exception as ex:
+            
+            self.LogInternalError("{0}: DB Schema Summary Error - {1}".format(methodName, str(ex)))
+            return
+
+        ctx:SITableViewerContext = SITableViewerContext()
+
+        try:
+        
+            # write the header first.
+            ctx.AppendHeader("Table, Kind, ID, Name, Details")
+
+            # write the columns.
+            for column in tblSchema:
+
+                # add column info to the context view.
+                ctx.BeginRow()
+                ctx.AddRowEntry(str(column[0]))
+                ctx.AddRowEntry(str(column[1]))
+                ctx.AddRowEntry(str(column[2]))
+                ctx.AddRowEntry(str(column[3]))
+                ctx.AddRowEntry(str(column[4]))
+                ctx.EndRow()
+
+            # send the packet.
+            self._SendContext(level, title, SILogEntryType.DatabaseStructure, ctx, colorValue)
+        
+        except Exception as ex:
+            
+            self.LogInternalError("{0}: {1}".format(methodName, str(ex)))
+
+
     def LogSqliteDbSchemaTableInfo(self, level:SILevel=None, title:str=None, conn:sqlite3.Connection=None, tableName:str=None, sortByName:bool=False, colorValue:SIColors=None) -> None:
         """
         Logs the schema of a Sqlite DB Table with a custom title and custom log level.
@@ -4903,9 +5034,12 @@ class SISession:
 
         v:str = str(value)
         if (includeHex):
-            vhex:str = " (" + hex(value).upper() + ")"
-            vhex = vhex.replace("0X","0x")      # make "0X" lower-case since hex values will be in upper-case
-            v += vhex
+            if (0 <= value <= 255):
+                v += SISession._HEX_BYTE[value]
+            else:
+                vhex:str = " (" + hex(value).upper() + ")"
+                vhex = vhex.replace("0X","0x")      # make "0X" lower-case since hex values will be in upper-case
+                v += vhex
             
         self._SendWatch(level, name, v, SIWatchType.Integer)
 
@@ -5029,11 +5163,14 @@ class SISession:
 
         v:str = str(value)
         if (includeHex):
-            vhex:str = " (" + hex(value).upper() + ")"
-            if (value < 0):
-                vhex = vhex.replace("-","")     # remove minus sign for negative values.
-            vhex = vhex.replace("0X","0x")      # make "0X" lower-case since hex values will be in upper-case
-            v += vhex
+            if (0 <= value <= 255):
+                v += SISession._HEX_BYTE[value]
+            else:
+                vhex:str = " (" + hex(value).upper() + ")"
+                if (value < 0):
+                    vhex = vhex.replace("-","")     # remove minus sign for negative values.
+                vhex = vhex.replace("0X","0x")      # make "0X" lower-case since hex values will be in upper-case
+                v += vhex
             
         self._SendWatch(level, name, v, SIWatchType.Integer)
 
@@ -1,6 +1,8 @@
 # external package imports.
 from io import BufferedRWPair, BytesIO
 import socket
+import threading
+import time
 
 # our package imports.
 from .sibinaryformatter import SIBinaryFormatter
@@ -8,6 +10,7 @@ from .siconnectionsbuilder import SIConnectionsBuilder
 from .siformatter import SIFormatter
 from .sipacket import SIPacket
 from .siprotocol import SIProtocol
+from .siprotocolexception import SIProtocolException
 from .smartinspectexception import SmartInspectException
 
 # our package constants.
@@ -42,6 +45,12 @@ class SITcpProtocol(SIProtocol):
     _SERVER_ANSWER_SIZE:int = 2
     """ Expected server response length. """
 
+    _DEFAULT_BUFFER:int = 0x2000
+    """ 8kb socket stream buffer if custom buffering not specified. """
+
+    _DEFAULT_BUFFER_MAXPACKETS:int = 512
+    """ Maximum number of buffered packets (and unread server answers) if not specified. """
+
 
     def __init__(self) -> None:
         """
@@ -59,6 +68,17 @@ class SITcpProtocol(SIProtocol):
         self._fTcpHostName:str = "127.0.0.1"
         self._fTcpPort:int = 4228
         self._fTcpTimeout:int = 30000
+        self._fTcpNoDelay:bool = False
+        self._fTcpSendBufferSize:int = 0
+        self._fIOBuffer:int = 0
+        self._fIOBufferCounter:int = 0
+        self._fIOBufferFlushInterval:int = 1000
+        self._fIOBufferMaxPackets:int = SITcpProtocol._DEFAULT_BUFFER_MAXPACKETS
+        self._fIOBufferTime:float = 0
+        self._fPendingAnswers:int = 0
+        self._fBufferLock:threading.Lock = threading.Lock()
+        self._fFlushStopEvent:threading.Event = None
+        self._fFlushThread:threading.Thread = None
 
         # set default options.
         self.LoadOptions()
@@ -117,6 +137,83 @@ class SITcpProtocol(SIProtocol):
         stream.flush()
 
 
+    def _FlushBuffer(self) -> None:
+        """
+        Sends any buffered packets to the Console, and reads the server
+        answer for each packet that was sent.
+
+        Raises:
+            SmartInspectException:
+                Thrown if the server answers could not be read.
+
+        The caller must hold the buffer lock.
+        """
+        self._fStream.flush()
+
+        if (self._fPendingAnswers > 0):
+
+            # read server responses ("OK" for each packet if successful).
+            answerSize:int = self._fPendingAnswers * SITcpProtocol._SERVER_ANSWER_SIZE
+            self._fPendingAnswers = 0
+            self._fIOBufferCounter = 0
+            self._fAnswer = self._fStream.read(answerSize)
+            if (len(self._fAnswer) != answerSize):
+                raise SmartInspectException("Could not read server answer correctly: Connection has been closed unexpectedly.")
+
+
+    def _FlushBufferTask(self, stopEvent:threading.Event) -> None:
+        """
+        Sends buffered packets to the Console once the oldest of them has been
+        buffered for the "buffer.flushinterval" time, until a stop is requested.
+
+        Args:
+            stopEvent (threading.Event):
+                Event that is signalled by InternalDisconnect to stop the task.
+
+        This keeps packets from waiting in the buffer indefinitely when no more
+        packets are logged (e.g. when the application goes idle).  If sending
+        the packets fails, then the connection stream is closed so that the next
+        packet that is written reconnects, and the Error event is raised.
+        """
+        interval:float = self._fIOBufferFlushInterval / 1000.0
+        timeout:float = interval
+
+        # process until we are asked to stop; the stop event is signalled by 
+        # InternalDisconnect, so we wake up immediately when asked to stop.
+        while (not stopEvent.wait(timeout)):
+
+            with (self._fBufferLock):
+
+                if (stopEvent.is_set()):
+                    break
+
+                # wait for the remaining time of the oldest buffered packet.
+                timeout = interval
+                if (self._fPendingAnswers == 0):
+                    continue
+                age:float = time.monotonic() - self._fIOBufferTime
+                if (age < interval):
+                    timeout = interval - age
+                    continue
+
+                try:
+
+                    self._FlushBuffer()
+
+                except Exception as ex:
+
+                    # close the stream so that the next packet that is written
+                    # reconnects; closing tries to send the buffer again, which
+                    # fails the same way, so ignore exceptions.
+                    self._fFailed = True
+                    try:
+                        self._fStream.close()
+                    except Exception:
+                        pass
+                    self._RaiseErrorEvent(SIProtocolException(str(ex), self.Name, self._GetOptions()))
+                    break
+
+
     def BuildOptions(self, builder:SIConnectionsBuilder) -> None:
         """
         Overridden. Fills a SIConnectionsBuilder instance with the
@@ -134,6 +231,11 @@ class SITcpProtocol(SIProtocol):
         builder.AddOptionString("host", self._fTcpHostName)
         builder.AddOptionInteger("port", self._fTcpPort)
         builder.AddOptionInteger("timeout", self._fTcpTimeout)
+        builder.AddOptionBool("nodelay", self._fTcpNoDelay)
+        builder.AddOptionInteger("sndbuf", self._fTcpSendBufferSize // 1024)
+        builder.AddOptionInteger("buffer", self._fIOBuffer // 1024)
+        builder.AddOptionInteger("buffer.flushinterval", self._fIOBufferFlushInterval // 1000)
+        builder.AddOptionInteger("buffer.maxpackets", self._fIOBufferMaxPackets)
 
 
     def IsValidOption(self, name:str) -> bool:
@@ -155,6 +257,11 @@ class SITcpProtocol(SIProtocol):
         host ("127.0.0.1")             | Specifies the TCP host name or ip address that the SI Console is listening on.
         port (4228)                    | Specifies the TCP port number that the SI Console is listening on.
         timeout (30000)                | Specifies the connect, receive and send timeout in milliseconds.
+        nodelay (false)                | Specifies if the Nagle algorithm is disabled (TCP_NODELAY) for the socket, so that small packets are sent immediately.
+        sndbuf (0)                     | Specifies the socket send buffer size (SO_SNDBUF); supports byte units (e.g. "256KB").  A value of 0 uses the system default.
+        buffer (0)                     | Specifies the packet buffer size in kilobytes; supports byte units (e.g. "32KB").  A value of 0 disables this feature.  Enabling the buffer sends packets in batches and reads the Console answers for a batch at once, which greatly improves the logging performance but has the disadvantage that log packets are temporarily stored in memory and are not immediately sent to the Console.  Buffered packets are sent when the buffer size, the "buffer.maxpackets" count or the "buffer.flushinterval" time is exceeded, or when the connection is closed; packets that are still buffered are lost if the application terminates without closing the connection, or if the connection fails.
+        buffer.flushinterval (1)       | If the buffer is enabled, specifies the maximum time in seconds that a packet is buffered before it is sent to the Console, so that packets are not held back when the application goes idle; supports time span units (e.g. "5s").  A shorter interval lowers the latency (and the number of packets that can be lost) at the cost of smaller batches.  A value of 0 disables this feature, in which case packets are held until the buffer is full or the connection is closed.
+        buffer.maxpackets (512)        | If the buffer is enabled, specifies the maximum number of packets that are buffered before they are sent to the Console.  Each buffered packet has an unread Console answer, and this limit keeps the unread answers from filling the socket buffers when many small packets are buffered.
 
         <details>
             <summary>Sample Code</summary>
@@ -167,6 +274,11 @@ class SITcpProtocol(SIProtocol):
             (name == "host") or \
             (name == "port") or \
             (name == "timeout") or \
+            (name == "nodelay") or \
+            (name == "sndbuf") or \
+            (name == "buffer") or \
+            (name == "buffer.flushinterval") or \
+            (name == "buffer.maxpackets") or \
             (super().IsValidOption(name))
 
 
@@ -178,7 +290,8 @@ class SITcpProtocol(SIProtocol):
         Console. The hostname and port can be specified by passing
         the "hostname" and "port" options to the Initialize method.
         Furthermore, it is possible to specify the connect timeout
-        by using the "timeout" option.
+        by using the "timeout" option, and to tune the socket with the
+        "nodelay" and "sndbuf" options.
         
         Raises:
             Exception:
@@ -187,16 +300,33 @@ class SITcpProtocol(SIProtocol):
         # create a new socket for this connection.
         self._fSocket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
 
+        # disable the nagle algorithm and / or set the send buffer size if requested.
+        if (self._fTcpNoDelay):
+            self._fSocket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        if (self._fTcpSendBufferSize > 0):
+            self._fSocket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, self._fTcpSendBufferSize)
+
         # set send / receive timeout, and connect to the server.
         self._fSocket.settimeout(self._fTcpTimeout / 1000.0)
         self._fSocket.connect((self._fTcpHostName, self._fTcpPort))  # <- host and port has to be specified as tuple format - e.g. (host,port) 
 
         # get a reference to the socket buffer stream.
-        self._fStream = self._fSocket.makefile('rwb', buffering=0x2000)
+        # if a custom buffer size was selected, then size the stream buffer to hold it.
+        self._fStream = self._fSocket.makefile('rwb', buffering=max(self._fIOBuffer, SITcpProtocol._DEFAULT_BUFFER))
+        self._fIOBufferCounter = 0
+        self._fPendingAnswers = 0
 
         # exchange banners with the console server.
         self._DoHandShake(self._fStream)
 
+        # start the thread task that sends buffered packets that are not sent
+        # within the flush interval.
+        if (self._fIOBuffer > 0) and (self._fIOBufferFlushInterval > 0):
+            self._fFlushStopEvent = threading.Event()
+            self._fFlushThread = threading.Thread(target=self._FlushBufferTask, args=(self._fFlushStopEvent,), daemon=True)
+            self._fFlushThread.name = "SiTcpBufferFlushTask"
+            self._fFlushThread.start()
+
         # write a log header packet.
         self._WriteLogHeaderPacket() 
 
@@ -212,8 +342,21 @@ class SITcpProtocol(SIProtocol):
             Exception:
                 Closing the TCP socket failed.
         """
+        # stop the buffer flush thread task, and wait for it to finish up.
+        if (self._fFlushThread != None):
+            self._fFlushStopEvent.set()
+            self._fFlushThread.join()
+            self._fFlushThread = None
+            self._fFlushStopEvent = None
+
         if (self._fStream.writable or self._fStream.readable):
-            self._fStream.close()
+            try:
+                # send any buffered packets before closing the connection.
+                if (self._fIOBuffer > 0) and (not self._fStream.closed):
+                    with (self._fBufferLock):
+                        self._FlushBuffer()
+            finally:
+                self._fStream.close()
 
         if (self._fSocket != None):
             self._fSocket.close()
@@ -233,11 +376,31 @@ class SITcpProtocol(SIProtocol):
                 Sending the packet to the Console failed.
 
         This method sends the supplied packet to the SmartInspect
-        Console and waits for a valid response.
+        Console and waits for a valid response.  If the "buffer" option
+        is set, then packets are sent (and the responses read) once the
+        buffer size, the "buffer.maxpackets" count or the "buffer.flushinterval"
+        time is exceeded, or the connection is closed.
         """
         if (not self._fStream.writable):
             raise SmartInspectException("Underlying connection stream is no longer writeable, which indicates the connection no longer exists.")
 
+        # was a custom buffer size selected?
+        # if so, then only send the packets once the buffer size (or packet count) is exceeded.
+        # note that the flush thread task sends the packets once the flush interval is exceeded.
+        if (self._fIOBuffer > 0):
+
+            with (self._fBufferLock):
+
+                packetSize:int = self._fFormatter.Compile(packet)
+                self._fFormatter.Write(self._fStream)
+                if (self._fPendingAnswers == 0):
+                    self._fIOBufferTime = time.monotonic()
+                self._fPendingAnswers = self._fPendingAnswers + 1
+                self._fIOBufferCounter = self._fIOBufferCounter + packetSize
+                if (self._fIOBufferCounter > self._fIOBuffer) or (self._fPendingAnswers >= self._fIOBufferMaxPackets):
+                    self._FlushBuffer()
+            return
+
         self._fFormatter.Format(packet, self._fStream)
         self._fStream.flush()
 
@@ -262,3 +425,10 @@ class SITcpProtocol(SIProtocol):
         self._fTcpHostName = self.GetStringOption("host", "127.0.0.1")
         self._fTcpPort = self.GetIntegerOption("port", 4228)
         self._fTcpTimeout = self.GetIntegerOption("timeout", 30000)
+        self._fTcpNoDelay = self.GetBooleanOption("nodelay", False)
+        self._fTcpSendBufferSize = self.GetSizeOption("sndbuf", 0)
+        self._fIOBuffer = self.GetSizeOption("buffer", 0)
+        self._fIOBufferFlushInterval = self.GetTimespanOption("buffer.flushinterval", 1)
+        self._fIOBufferMaxPackets = self.GetIntegerOption("buffer.maxpackets", SITcpProtocol._DEFAULT_BUFFER_MAXPACKETS)
+        if (self._fIOBufferMaxPackets < 1):
+            self._fIOBufferMaxPackets = 1
@@ -1,6 +1,7 @@
 # external package imports.
 from datetime import datetime
 import sys
+import threading
 
 # our package imports.
 # none
@@ -47,13 +48,23 @@ class Event:
         """
         Initializes a new instance of the class.
         """
-        self.handlers = set()
+        # handlers are stored in an immutable tuple that is replaced (copy-on-write)
+        # whenever a handler is added or removed; this allows the event to be fired
+        # without a lock, and handlers to be added / removed while it is firing.
+        self.handlers:tuple = ()
+        self._fLock = threading.Lock()
 
     def fire(self, *args, **kargs):
         """
         Calls (i.e. "fires") all method handlers defined for this event.
         """
-        for handler in self.handlers:
+        # take a snapshot of the current handlers.
+        handlers:tuple = self.handlers
+
+        # nothing to do if no handlers are defined for this event.
+        if (not handlers):
+            return
+        for handler in handlers:
             handler(*args, **kargs)
 
     def getHandlerCount(self):
@@ -62,11 +73,25 @@ class Event:
         """
         return len(self.handlers)
 
+    def hasHandlers(self) -> bool:
+        """
+        Returns True if one or more method handlers are defined for this event;
+        otherwise, False.
+
+        Callers can use this to avoid building event arguments when there is no
+        one listening for the event.
+        """
+        return len(self.handlers) != 0
+
     def handle(self, handler):
         """
         Adds a method handler for this event.
+
+        A handler that is already defined for this event is not added again.
         """
-        self.handlers.add(handler)
+        with self._fLock:
+            if (handler not in self.handlers):
+                self.handlers = self.handlers + (handler,)
         return self
 
     def unhandle(self, handler):
@@ -79,11 +104,11 @@ class Event:
 
         This method will not throw an exception.
         """
-        try:
-            self.handlers.remove(handler)
-        except:
-            #raise ValueError("Handler is not handling this event, so cannot unhandle it.")
-            pass   # ignore exceptions.
+        # note that handlers are compared by equality (and not identity), as a
+        # bound method reference is a new object every time it is referenced.
+        with self._fLock:
+            if (handler in self.handlers):
+                self.handlers = tuple(h for h in self.handlers if h != handler)
         return self
 
     def unhandle_all(self):
@@ -92,11 +117,8 @@ class Event:
 
         This method will not throw an exception.
         """
-        try:
-            self.handlers.clear()
-        except:
-            #raise ValueError("Handler is not handling this event, so cannot unhandle all.")
-            pass   # ignore exceptions.
+        with self._fLock:
+            self.handlers = ()
         return self
 
     # alias method definitions.
@@ -104,6 +126,7 @@ class Event:
     __isub__ = unhandle
     __call__ = fire
     __len__  = getHandlerCount
+    __bool__ = hasHandlers
 
 
 class DataTypeHelper:
@@ -654,6 +654,10 @@ class SmartInspect:
 
         This method is used to inform interested parties that a ControlCommand item was just processed.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.ControlCommandEvent.hasHandlers()):
+            return
+
         try:
 
             # raise event.
@@ -676,6 +680,10 @@ class SmartInspect:
 
         This method is used to inform interested parties that an Error has occured.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.ErrorEvent.hasHandlers()):
+            return
+
         try:
 
             # raise event.
@@ -703,6 +711,10 @@ class SmartInspect:
             True if the supplied packet shall be filtered and thus not be sent;
             Otherwise, false.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.FilterEvent.hasHandlers()):
+            return False
+
         try:
 
             # raise event.
@@ -726,6 +738,10 @@ class SmartInspect:
 
         This method is used to inform interested parties that a Log Entry item was just processed.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.LogEntryEvent.hasHandlers()):
+            return
+
         try:
 
             # raise event.
@@ -748,6 +764,10 @@ class SmartInspect:
 
         This method is used to inform interested parties that a Process Flow item was just processed.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.ProcessFlowEvent.hasHandlers()):
+            return
+
         try:
 
             # raise event.
@@ -770,6 +790,10 @@ class SmartInspect:
 
         This method is used to inform interested parties that a watch item was just processed.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.WatchEvent.hasHandlers()):
+            return
+
         try:
 
             # raise event.
@@ -1622,6 +1646,10 @@ class SmartInspect:
 
         This method is used to inform interested parties that an Informational event has occured.
         """
+        # if no one is listening then don't bother building the event arguments.
+        if (not self.InfoEvent.hasHandlers()):
+            return
+
         try:
 
             # raise event.
@@ -1,4 +1,7 @@
 from io import BufferedReader, TextIOWrapper
+from operator import itemgetter
+import sys
+import threading
 
 # our package imports.
 from smartinspectpython.siauto import *
@@ -16,18 +19,29 @@ class SIEventHandlerClass:
 
     # static variables.
     WriteEventPacketsToConsole:bool = False
-    ErrorCount:int = 0
-    InfoCount:int = 0
-    FilterCount:int = 0
-    FilterCancelCount:int = 0
-    WatchCount:int = 0
-    LogEntryCount:int = 0
-    ProcessFlowCount:int = 0
-    ControlCommandCount:int = 0
-    TotalCount:int = 0
+
+    # event counters of each SmartInspect instance (see GetCounters).
+    _COUNTER_NAMES:tuple = ("ErrorCount", "InfoCount", "FilterCount", "FilterCancelCount", "WatchCount", "LogEntryCount", "ProcessFlowCount", "ControlCommandCount", "TotalCount")
+    _TOTAL_COUNTER_NAMES:frozenset = frozenset(("WatchCount", "LogEntryCount", "ProcessFlowCount", "ControlCommandCount"))
+    _Counters:dict = {}
+    _CountersLock:threading.Lock = threading.Lock()
+
+    # counters logged by WatchCounters, and the format of the logged value; 
+    # both are built once instead of on every call.
+    _WatchCountersGetter:itemgetter = itemgetter("LogEntryCount", "ProcessFlowCount", "ControlCommandCount", "WatchCount", "FilterCount", "ErrorCount", "InfoCount")
+    _WATCH_COUNTERS_FORMAT:str = "LogEntry={0}, ProcessFlow={1}, ControlCmd={2}, Watch={3}, Filtered={4}, Error={5}, Info={6}"
+
+    # SmartInspect instances that currently have the event handlers wired, so
+    # that repeated WireEvents calls do not wire (and count) events twice.
+    _Wired:set = set()
 
     @staticmethod
     def WireEvents(si) -> None:
+        # if events are already wired for this instance then we are done.
+        if (si in SIEventHandlerClass._Wired):
+            return
+        SIEventHandlerClass._Wired.add(si)
+
         # wire up events.
         si.ErrorEvent += SIEventHandlerClass.ErrorEvent
         si.InfoEvent += SIEventHandlerClass.InfoEvent
@@ -36,10 +50,14 @@ class SIEventHandlerClass:
         si.LogEntryEvent += SIEventHandlerClass.LogEntryEvent
         si.ProcessFlowEvent += SIEventHandlerClass.ProcessFlowEvent
         si.ControlCommandEvent += SIEventHandlerClass.ControlCommandEvent
-        pass
 
     @staticmethod
     def UnWireEvents(si) -> None:
+        # if events are not wired for this instance then we are done.
+        if (si not in SIEventHandlerClass._Wired):
+            return
+        SIEventHandlerClass._Wired.discard(si)
+
         # unwire events.
         si.ErrorEvent -= SIEventHandlerClass.ErrorEvent
         si.InfoEvent -= SIEventHandlerClass.InfoEvent
@@ -48,100 +66,116 @@ class SIEventHandlerClass:
         si.LogEntryEvent -= SIEventHandlerClass.LogEntryEvent
         si.ProcessFlowEvent -= SIEventHandlerClass.ProcessFlowEvent
         si.ControlCommandEvent -= SIEventHandlerClass.ControlCommandEvent
-        pass
 
     def ErrorEvent(sender:object, e:SIErrorEventArgs) -> None:
         print("* SIEvent {0}".format(str(e)))
-        SIEventHandlerClass.ErrorCount = SIEventHandlerClass.ErrorCount + 1
-        pass
+        SIEventHandlerClass._AddCount(sender, "ErrorCount")
 
     def InfoEvent(sender:object, e:SIInfoEventArgs) -> None:
         print("* SIEvent {0}".format(str(e)))
-        SIEventHandlerClass.InfoCount = SIEventHandlerClass.InfoCount + 1
-        pass
+        SIEventHandlerClass._AddCount(sender, "InfoCount")
 
     def FilterEvent(sender:object, e:SIFilterEventArgs) -> None:
         if SIEventHandlerClass.WriteEventPacketsToConsole:
             print("* SIEvent {0}".format(str(e)))
         # ignore all warning level packets.
         #if (e.Packet.Level == SILevel.Warning):
-        #    SIEventHandlerClass.FilterCancelCount = SIEventHandlerClass.FilterCancelCount + 1
+        #    SIEventHandlerClass._AddCount(sender, "FilterCancelCount")
         #    e.Cancel = True
-        SIEventHandlerClass.FilterCount = SIEventHandlerClass.FilterCount + 1
-        pass
+        SIEventHandlerClass._AddCount(sender, "FilterCount")
 
     def WatchEvent(sender:object, e:SIWatchEventArgs) -> None:
         if SIEventHandlerClass.WriteEventPacketsToConsole:
             print("* SIEvent {0}".format(str(e)))
-        SIEventHandlerClass.TotalCount = SIEventHandlerClass.TotalCount + 1
-        SIEventHandlerClass.WatchCount = SIEventHandlerClass.WatchCount + 1
-        pass
+        SIEventHandlerClass._AddCount(sender, "WatchCount")
 
     def LogEntryEvent(sender:object, e:SILogEntryEventArgs) -> None:
         if SIEventHandlerClass.WriteEventPacketsToConsole:
             print("* SIEvent {0}".format(str(e)))
-        SIEventHandlerClass.TotalCount = SIEventHandlerClass.TotalCount + 1
-        SIEventHandlerClass.LogEntryCount = SIEventHandlerClass.LogEntryCount + 1
-        pass
+        SIEventHandlerClass._AddCount(sender, "LogEntryCount")
 
     def ProcessFlowEvent(sender:object, e:SIProcessFlowEventArgs) -> None:
         if SIEventHandlerClass.WriteEventPacketsToConsole:
             print("* SIEvent {0}".format(str(e)))
-        SIEventHandlerClass.TotalCount = SIEventHandlerClass.TotalCount + 1
-        SIEventHandlerClass.ProcessFlowCount = SIEventHandlerClass.ProcessFlowCount + 1
-        pass
+        SIEventHandlerClass._AddCount(sender, "ProcessFlowCount")
 
     def ControlCommandEvent(sender:object, e:SIControlCommandEventArgs) -> None:
         if SIEventHandlerClass.WriteEventPacketsToConsole:
             print("* SIEvent {0}".format(str(e)))
-        SIEventHandlerClass.TotalCount = SIEventHandlerClass.TotalCount + 1
-        SIEventHandlerClass.ControlCommandCount = SIEventHandlerClass.ControlCommandCount + 1
-        pass
+        SIEventHandlerClass._AddCount(sender, "ControlCommandCount")
+
+    @staticmethod
+    def GetCounters(si) -> dict:
+        # returns the event counters of a SmartInspect instance, so that multiple
+        # instances can be tested in parallel without their counts colliding.
+        # a session can also be passed, in which case its parent is used.
+        si = getattr(si, "Parent", si)
+        with (SIEventHandlerClass._CountersLock):
+            counters:dict = SIEventHandlerClass._Counters.get(si)
+            if (counters == None):
+                counters = dict.fromkeys(SIEventHandlerClass._COUNTER_NAMES, 0)
+                SIEventHandlerClass._Counters[si] = counters
+            return counters
+
+    @staticmethod
+    def _AddCount(sender:object, name:str) -> None:
+        counters:dict = SIEventHandlerClass.GetCounters(sender)
+        with (SIEventHandlerClass._CountersLock):
+            counters[name] += 1
+            if (name in SIEventHandlerClass._TOTAL_COUNTER_NAMES):
+                counters["TotalCount"] += 1
 
     def ResetCounters(si) -> None:
         print("Resetting all SIEventHandlerClass counters to zero.")
-        SIEventHandlerClass.ErrorCount:int = 0
-        SIEventHandlerClass.InfoCount:int = 0
-        SIEventHandlerClass.FilterCount:int = 0
-        SIEventHandlerClass.FilterCancelCount:int = 0
-        SIEventHandlerClass.WatchCount:int = 0
-        SIEventHandlerClass.LogEntryCount:int = 0
-        SIEventHandlerClass.ProcessFlowCount:int = 0
-        SIEventHandlerClass.ControlCommandCount:int = 0
-        SIEventHandlerClass.TotalCount:int = 0
+        counters:dict = SIEventHandlerClass.GetCounters(si)
+        with (SIEventHandlerClass._CountersLock):
+            counters.update(dict.fromkeys(SIEventHandlerClass._COUNTER_NAMES, 0))
 
     def PrintResults(si) -> str:
-        print("")
-        print("SI Protocol Connections string used for this test:\n" + si.Connections)
-        print("")
-        print("SI Event Handler Results:")
-        print("")
-        print("- # Watch Events          = " + str(SIEventHandlerClass.WatchCount))
-        print("- # LogEntry Events       = " + str(SIEventHandlerClass.LogEntryCount))
-        print("- # ProcessFlow Events    = " + str(SIEventHandlerClass.ProcessFlowCount))
-        print("- # ControlCommand Events = " + str(SIEventHandlerClass.ControlCommandCount))
-        print("")
-        print("- # Total Events          = " + str(SIEventHandlerClass.TotalCount))
-        print("")
-        print("- # Error Events          = " + str(SIEventHandlerClass.ErrorCount))
-        print("- # Info Events           = " + str(SIEventHandlerClass.InfoCount))
-        print("- # Filter Events         = " + str(SIEventHandlerClass.FilterCount))
-        print("- # Filter Cancel Events  = " + str(SIEventHandlerClass.FilterCancelCount))
-        print("")
+        counters:dict = SIEventHandlerClass.GetCounters(si)
+        # build the results, and write them to the console with a single write.
+        lines:list = [
+            "",
+            "SI Protocol Connections string used for this test:",
+            si.Connections,
+            "",
+            "SI Event Handler Results:",
+            "",
+            "- # Watch Events          = {0}".format(counters["WatchCount"]),
+            "- # LogEntry Events       = {0}".format(counters["LogEntryCount"]),
+            "- # ProcessFlow Events    = {0}".format(counters["ProcessFlowCount"]),
+            "- # ControlCommand Events = {0}".format(counters["ControlCommandCount"]),
+            "",
+            "- # Total Events          = {0}".format(counters["TotalCount"]),
+            "",
+            "- # Error Events          = {0}".format(counters["ErrorCount"]),
+            "- # Info Events           = {0}".format(counters["InfoCount"]),
+            "- # Filter Events         = {0}".format(counters["FilterCount"]),
+            "- # Filter Cancel Events  = {0}".format(counters["FilterCancelCount"]),
+            "",
+            "",
+        ]
+        sys.stdout.write("\n".join(lines))
+
+    def WatchCounters(logsi) -> None:
+        # log the event counters to the SI console with a single Watch packet,
+        # instead of one Watch packet per counter.
+        counters:dict = SIEventHandlerClass.GetCounters(logsi)
+        logsi.Watch(SILevel.Fatal, "Total Packets", SIEventHandlerClass._WATCH_COUNTERS_FORMAT.format(*SIEventHandlerClass._WatchCountersGetter(counters)))
 
     def VerifyLogEntryCounts(si, level, levelcounts) -> None:
-        for key in levelcounts.keys():
-            if (str(level.name) == key):
-                levelcount:int = levelcounts[key]
-                if (SIEventHandlerClass.LogEntryCount == levelcount):
-                    print("Level \"{0}\" LogEntryCount of {1} matches expected count of {2}.".format(str(level.name), str(SIEventHandlerClass.LogEntryCount), str(levelcount)))
-                else:
-                    #raise Exception("Test FAILED!  Level \"{0}\" LogEntryCount of {1} does not match expected count of {2}!  See console output for more details.".format(str(level.name), str(SIEventHandlerClass.LogEntryCount), str(levelcount)))
-                    print("**** WARNING **** Level \"{0}\" LogEntryCount of {1} does not match expected count of {2}.".format(str(level.name), str(SIEventHandlerClass.LogEntryCount), str(levelcount)))
+        # level counts are indexed by SILevel value.
+        levelcount:int = levelcounts[level.value]
+        logEntryCount:int = SIEventHandlerClass.GetCounters(si)["LogEntryCount"]
+        if (logEntryCount == levelcount):
+            print("Level \"{0}\" LogEntryCount of {1} matches expected count of {2}.".format(str(level.name), str(logEntryCount), str(levelcount)))
+        else:
+            #raise Exception("Test FAILED!  Level \"{0}\" LogEntryCount of {1} does not match expected count of {2}!  See console output for more details.".format(str(level.name), str(SIEventHandlerClass.LogEntryCount), str(levelcount)))
+            print("**** WARNING **** Level \"{0}\" LogEntryCount of {1} does not match expected count of {2}.".format(str(level.name), str(logEntryCount), str(levelcount)))
 
 
     def VerifyErrorCount(si, level) -> None:
-        if SIEventHandlerClass.ErrorCount > 0:
+        if SIEventHandlerClass.GetCounters(si)["ErrorCount"] > 0:
             raise Exception("Test FAILED!  ErrorCount > 0 for Level \"{0}\" test!  See console output for more details.".format(str(level.name)))
 
 
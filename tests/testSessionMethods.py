@@ -1,5 +1,6 @@
 from array import array as arr
 from datetime import datetime
+import functools
 import threading
 from inspect import FrameInfo
 import inspect
@@ -34,14 +35,38 @@ class TestSessionMethods:
     Helper class for SmartInspect SISession class testing.
     """
 
-    # TestAllMethods method message count values for each log level type.
-    TestAllMethods_LogEntryCounts = {}
-    TestAllMethods_LogEntryCounts[str(SILevel.Debug.name)] = 1027
-    TestAllMethods_LogEntryCounts[str(SILevel.Verbose.name)] = 802
-    TestAllMethods_LogEntryCounts[str(SILevel.Message.name)] = 685
-    TestAllMethods_LogEntryCounts[str(SILevel.Warning.name)] = 562
-    TestAllMethods_LogEntryCounts[str(SILevel.Error.name)] = 447
-    TestAllMethods_LogEntryCounts[str(SILevel.Fatal.name)] = 327
+    # TestAllMethods method message count values for each log level type, indexed by SILevel value.
+    TestAllMethods_LogEntryCounts = arr('i', [0] * len(SILevel))
+    TestAllMethods_LogEntryCounts[SILevel.Debug.value] = 1027
+    TestAllMethods_LogEntryCounts[SILevel.Verbose.value] = 802
+    TestAllMethods_LogEntryCounts[SILevel.Message.value] = 685
+    TestAllMethods_LogEntryCounts[SILevel.Warning.value] = 562
+    TestAllMethods_LogEntryCounts[SILevel.Error.value] = 447
+    TestAllMethods_LogEntryCounts[SILevel.Fatal.value] = 327
+
+    # TestAllMethods method message count values for each log level type, indexed by SILevel value,
+    # when the SmartInspect DefaultLevel is set to the same level as the SmartInspect Level; log
+    # methods called without a level argument are then logged at that level instead of Debug.
+    TestAllMethods_LogEntryCountsDefaultLevel = arr('i', [0] * len(SILevel))
+    TestAllMethods_LogEntryCountsDefaultLevel[SILevel.Debug.value] = 1027
+    TestAllMethods_LogEntryCountsDefaultLevel[SILevel.Verbose.value] = 910
+    TestAllMethods_LogEntryCountsDefaultLevel[SILevel.Message.value] = 793
+    TestAllMethods_LogEntryCountsDefaultLevel[SILevel.Warning.value] = 668
+    TestAllMethods_LogEntryCountsDefaultLevel[SILevel.Error.value] = 553
+    TestAllMethods_LogEntryCountsDefaultLevel[SILevel.Fatal.value] = 431
+
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _ReadTestDataText(path:str) -> str:
+        """
+        Returns the contents of a test data text file.
+
+        The contents are read once and shared by all TestAllMethods calls, 
+        instead of every call (one per level / session) holding its own copy.
+        """
+        with open(path, "r") as f:
+            return f.read()
+
 
     @staticmethod
     def TestAllMethods(logsi:SISession) -> None:
@@ -59,15 +84,13 @@ class TestSessionMethods:
         testdataPath:str = ""
         testtext:str = ""
         testdate:datetime = datetime.now()
-        binaryBytes:bytes = bytes([0x00,0x01,0x02,0x03,0x04,0x05,0x06,0x07,0x08,0x09,0x0a,0x0b,0x0c,0x0d,0x0e,0x0f,0x10,0x11,0x12,0x13,0x14,0x15,0x16])
+        binaryBytes:bytes = bytes(range(0x17))
         argsVar1:str="Argument 1 Value"
         argsVar2:int=1000
         
         # load test data files to string variables for log methods that require string content.
-        with open(testdataPfx + "TestSourceXML.xml", "r") as f:
-            testSourceXML:str = f.read()
-        with open(testdataPfx + "TestSourceHTML.html", "r") as f:
-            testSourceHTML:str = f.read()
+        testSourceXML:str = TestSessionMethods._ReadTestDataText(testdataPfx + "TestSourceXML.xml")
+        testSourceHTML:str = TestSessionMethods._ReadTestDataText(testdataPfx + "TestSourceHTML.html")
 
         print("-----------------------------------------------------------------------------------------")
         print("Test ALL Session Methods Starting")
@@ -1787,22 +1810,18 @@ class TestSessionMethods:
 
             logsi.LogException("Unhandled exception!  This should NEVER happen, since it would cause an exception to be thrown in the code that is being debugged!", ex)
 
-        finally:
-
-            pass
-
         print("TestSessionMethods ended.")
 
 
 
-    # TestAllMethods method message count values for each log level type.
-    TestMessageMethods_LogEntryCounts = {}
-    TestMessageMethods_LogEntryCounts[str(SILevel.Debug.name)] = 5
-    TestMessageMethods_LogEntryCounts[str(SILevel.Verbose.name)] = 5
-    TestMessageMethods_LogEntryCounts[str(SILevel.Message.name)] = 5
-    TestMessageMethods_LogEntryCounts[str(SILevel.Warning.name)] = 5
-    TestMessageMethods_LogEntryCounts[str(SILevel.Error.name)] = 5
-    TestMessageMethods_LogEntryCounts[str(SILevel.Fatal.name)] = 5
+    # TestAllMethods method message count values for each log level type, indexed by SILevel value.
+    TestMessageMethods_LogEntryCounts = arr('i', [0] * len(SILevel))
+    TestMessageMethods_LogEntryCounts[SILevel.Debug.value] = 5
+    TestMessageMethods_LogEntryCounts[SILevel.Verbose.value] = 5
+    TestMessageMethods_LogEntryCounts[SILevel.Message.value] = 5
+    TestMessageMethods_LogEntryCounts[SILevel.Warning.value] = 5
+    TestMessageMethods_LogEntryCounts[SILevel.Error.value] = 5
+    TestMessageMethods_LogEntryCounts[SILevel.Fatal.value] = 5
 
     @staticmethod
     def TestMessageMethods(logsi:SISession) -> None:
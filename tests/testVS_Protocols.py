@@ -1,7 +1,9 @@
 import sys
-sys.path.append("..")
+if (".." not in sys.path):
+    sys.path.append("..")
 
 import unittest
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # our package imports.
 from smartinspectpython.smartinspect import SmartInspect
@@ -12,6 +14,17 @@ from smartinspectpython.silevel import SILevel
 from testClassDefinitions import SIEventHandlerClass
 from testSessionMethods import TestSessionMethods
 
+# connections strings used by the tests:
+# - tcp:  host=localhost, port=4228 (SI Console tcp server is listening on same machine).
+# - pipe: pipename=smartinspect (SI Console is running on same machine).
+# - async.enabled=true (Send packets to SI Console asyncronously on a separate thread).
+# - buffer=32 (Send packets to SI Console in 32 KB batches).
+CONNECTION_TCP:str = "tcp(host=localhost,port=4228,timeout=30000,nodelay=true,reconnect=true,reconnect.interval=10s,async.enabled=false)"
+CONNECTION_TCP_BUFFERED:str = "tcp(host=localhost,port=4228,timeout=30000,nodelay=true,buffer=32,reconnect=true,reconnect.interval=10s,async.enabled=false)"
+CONNECTION_TCP_ASYNC:str = "tcp(host=localhost,port=4228,timeout=30000,nodelay=true,reconnect=true,reconnect.interval=10s,async.enabled=true)"
+CONNECTION_PIPE:str = "pipe(pipename=smartinspect,buffer=32,reconnect=true,reconnect.interval=10s,async.enabled=false)"
+CONNECTION_PIPE_ASYNC:str = "pipe(pipename=smartinspect,reconnect=true,reconnect.interval=10s,async.enabled=true)"
+
 class Test_Protocols(unittest.TestCase):
     """
     Test all SISession scenarios.
@@ -54,47 +67,66 @@ class Test_Protocols(unittest.TestCase):
             raise
 
 
-    def test_ProtocolTcp(self):
+    def _RunLevelsParallel(self, connectionstring:str, setDefaultLevel:bool, levelcounts) -> None:
         """
-        Test TCP Protocol scenarios.
+        Tests all session methods for each logging level in parallel.
+
+        Args:
+            connectionstring (str):
+                Connections string used by the SmartInspect instances.
+            setDefaultLevel (bool):
+                True to also set the SmartInspect DefaultLevel to the level under
+                test; otherwise, False to leave the DefaultLevel at Debug.
+            levelcounts (array):
+                Expected LogEntry counts, indexed by SILevel value.
+
+        Each logging level is tested on its own SmartInspect instance (and
+        connection), and the levels are run in parallel so that the network
+        round trips of each level overlap.
         """
-        _logsi:SISession = None
+        sessions:list = []
 
         try:
 
-            # set connections string: tcp protocol:
-            # - host=localhost (SI Console is running on same machine).
-            # - port=4228      (SI Console tcp server is listening is running on same machine).
-            conn:str = "tcp(host=localhost,port=4228,timeout=30000,reconnect=true,reconnect.interval=10s,async.enabled=false)"
-
-            # create a new smartinspect session for logging.
-            _logsi = Test_Protocols.CreateSISession(conn)
+            # write packet events to console.
+            SIEventHandlerClass.WriteEventPacketsToConsole = True;
 
+            # create a new smartinspect session for each logging level.
             for level in SILevel:
 
                 # ignore the Control level.
                 if (level == SILevel.Control):
                     continue
 
-                # reset counters for next test.
+                _logsi:SISession = Test_Protocols.CreateSISession(connectionstring)
+                _logsi.Parent.Level = level
+                if (setDefaultLevel):
+                    _logsi.Parent.DefaultLevel = level
                 SIEventHandlerClass.ResetCounters(_logsi.Parent)
+                sessions.append((level, _logsi))
 
-                # write packet events to console.
-                SIEventHandlerClass.WriteEventPacketsToConsole = True;
+            # test all session methods, using specified logging level for each session.
+            with ThreadPoolExecutor(max_workers=len(sessions)) as executor:
 
-                # test all session methods, using specified logging level.
-                _logsi.Parent.Level = level
-                _logsi.Parent.DefaultLevel = level
-                TestSessionMethods.TestAllMethods(_logsi)
+                futures:dict = {executor.submit(TestSessionMethods.TestAllMethods, _logsi): (level, _logsi) for level, _logsi in sessions}
 
-                # print SI event counts.
-                SIEventHandlerClass.PrintResults(_logsi.Parent)
+                for future in as_completed(futures):
 
-                # verify log entry counts; fail test if count does not match expected value for the specified level.
-                SIEventHandlerClass.VerifyLogEntryCounts(_logsi, level, TestSessionMethods.TestAllMethods_LogEntryCounts)
-                SIEventHandlerClass.VerifyErrorCount(_logsi, level)
+                    level, _logsi = futures[future]
 
-                print("Test was Successful!")
+                    with self.subTest(level=level):
+
+                        # re-raise any exception that occured in the worker.
+                        future.result()
+
+                        # print SI event counts.
+                        SIEventHandlerClass.PrintResults(_logsi.Parent)
+
+                        # verify log entry counts; fail test if count does not match expected value for the specified level.
+                        SIEventHandlerClass.VerifyLogEntryCounts(_logsi, level, levelcounts)
+                        SIEventHandlerClass.VerifyErrorCount(_logsi, level)
+
+                        print("Test was Successful!")
 
         except Exception as ex:
 
@@ -104,11 +136,43 @@ class Test_Protocols(unittest.TestCase):
         finally:
 
             # unwire test events, and dispose of SmartInspect oject.
-            if (_logsi != None):
+            for level, _logsi in sessions:
                 SIEventHandlerClass.UnWireEvents(_logsi.Parent)
                 _logsi.Parent.Dispose()
 
 
+    def test_ProtocolTcp(self):
+        """
+        Test TCP Protocol scenarios.
+
+        Each logging level is tested on its own SmartInspect instance (and
+        TCP connection), and the levels are run in parallel.  The DefaultLevel
+        is left at Debug; see test_ProtocolTcpDefaultLevel for the scenario
+        where the DefaultLevel is set to the level under test.
+        """
+        self._RunLevelsParallel(CONNECTION_TCP, False, TestSessionMethods.TestAllMethods_LogEntryCounts)
+
+
+    def test_ProtocolTcpDefaultLevel(self):
+        """
+        Test TCP Protocol scenarios, with the DefaultLevel set to the level under test.
+
+        Log methods that are called without a level argument are logged at the
+        DefaultLevel, so the expected counts differ from test_ProtocolTcp.
+        """
+        self._RunLevelsParallel(CONNECTION_TCP, True, TestSessionMethods.TestAllMethods_LogEntryCountsDefaultLevel)
+
+
+    def test_ProtocolTcpBuffered(self):
+        """
+        Test TCP Protocol scenarios, using packet buffering.
+
+        Packets are sent to the SI Console in batches of the buffer size instead
+        of one packet at a time, and the console answers are read per batch.
+        """
+        self._RunLevelsParallel(CONNECTION_TCP_BUFFERED, False, TestSessionMethods.TestAllMethods_LogEntryCounts)
+
+
     def test_ProtocolTcpAsync(self):
         """
         Test TCP Protocol scenarios, using Asyncronous packet processing.
@@ -117,14 +181,8 @@ class Test_Protocols(unittest.TestCase):
 
         try:
 
-            # set connections string: tcp protocol:
-            # - host=localhost  (SI Console is running on same machine).
-            # - port=4228       (SI Console tcp server is listening is running on same machine).
-            # - async=true      (Send packets to SI Console asyncronously on a separate thread).
-            conn:str = "tcp(host=localhost,port=4228,timeout=30000,reconnect=true,reconnect.interval=10s,async.enabled=true)"
-
             # create a new smartinspect session for logging.
-            _logsi = Test_Protocols.CreateSISession(conn)
+            _logsi = Test_Protocols.CreateSISession(CONNECTION_TCP_ASYNC)
 
             for level in SILevel:
 
@@ -167,12 +225,8 @@ class Test_Protocols(unittest.TestCase):
 
         try:
 
-            # set connections string: pipe protocol:
-            # - pipename=smartinspect (SI Console is running on same machine).
-            conn:str = "pipe(pipename=smartinspect,reconnect=true,reconnect.interval=10s,async.enabled=false)"
-
             # create a new smartinspect session for logging.
-            _logsi = Test_Protocols.CreateSISession(conn)
+            _logsi = Test_Protocols.CreateSISession(CONNECTION_PIPE)
 
             for level in SILevel:
 
@@ -217,13 +271,8 @@ class Test_Protocols(unittest.TestCase):
 
         try:
 
-            # set connections string: pipe protocol:
-            # - pipename=smartinspect (SI Console is running on same machine).
-            # - async=true      (Send packets to SI Console asyncronously on a separate thread).
-            conn:str = "pipe(pipename=smartinspect,reconnect=true,reconnect.interval=10s,async.enabled=true)"
-
             # create a new smartinspect session for logging.
-            _logsi = Test_Protocols.CreateSISession(conn)
+            _logsi = Test_Protocols.CreateSISession(CONNECTION_PIPE_ASYNC)
 
             for level in SILevel:
 
@@ -260,5 +309,36 @@ class Test_Protocols(unittest.TestCase):
                 _logsi.Parent.Dispose()
 
 
+def RunTestsParallel() -> bool:
+    """
+    Runs all Test_Protocols tests in parallel, one thread per test.
+
+    The protocol tests are independent of each other (each one uses its own
+    SmartInspect instances and event counters), and are I/O-bound on their
+    own sockets / pipes, so they can overlap.
+
+    Returns:
+        True if all tests were successful; otherwise, False.
+    """
+    tests:list = list(unittest.defaultTestLoader.loadTestsFromTestCase(Test_Protocols))
+
+    with ThreadPoolExecutor(max_workers=len(tests)) as executor:
+        results:list = list(executor.map(lambda test: test.run(unittest.TestResult()), tests))
+
+    # report results of all tests.
+    success:bool = True
+    for test, result in zip(tests, results):
+        for failedTest, trace in (result.errors + result.failures):
+            print("\n{0}: {1}\n{2}".format("FAIL", str(failedTest), trace))
+        success = success and result.wasSuccessful()
+    print("\nRan {0} tests in parallel: {1}".format(len(tests), "OK" if success else "FAILED"))
+    return success
+
+
 if __name__ == '__main__':
-    unittest.main()
+    # run specific tests (if specified on the command line) with the unittest
+    # runner; otherwise, run all tests in parallel.
+    if (len(sys.argv) > 1):
+        unittest.main()
+    else:
+        sys.exit(0 if RunTestsParallel() else 1)
@@ -1,5 +1,6 @@
 import sys
-sys.path.append("..")
+if (".." not in sys.path):
+    sys.path.append("..")
 
 import unittest
 from datetime import datetime
@@ -17,11 +18,54 @@ from testClassDefinitions import SIEventHandlerClass
 CONNECTION_TCP:str = "tcp(host=localhost,port=4228,timeout=30000,reconnect=true,reconnect.interval=10s,async.enabled=false)"
 CONNECTION_FILE_HOURLY24:str = "file(filename=\"./tests/logfilesVSTest\\FileProtocol-RotateHourly24.sil\", rotate=hourly, maxparts=24, append=true)"
 
+# message titles and ARGB values of all known colors, used by test_AllColors.
+_COLORS:list = [("This is a message in color '{0}'.".format(s.name), s.value) for s in SIColors]
+
 class Test_SISession(unittest.TestCase):
     """
     Test all SISession scenarios.
     """
-    
+
+    _Sessions:dict = {}
+    """ Main sessions created by _GetSISession, keyed by connection string. """
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """
+        Disposes of the SmartInspect objects of all cached sessions.
+        """
+        for _logsi in cls._Sessions.values():
+            SIEventHandlerClass.UnWireEvents(_logsi.Parent)
+            _logsi.Parent.Dispose()
+        cls._Sessions.clear()
+
+
+    @classmethod
+    def _GetSISession(cls, connectionstring:str, sessionName:str="Main") -> SISession:
+        """
+        Returns the named session for the specified connection string.
+
+        One SmartInspect object (and connection) is created per connection
+        string on first use, and shared by all test methods; each test logs
+        to its own session of the shared object.  This way the connection
+        setup (and TCP handshake) is only performed once.
+        """
+        _logsi:SISession = cls._Sessions.get(connectionstring)
+        if (_logsi == None):
+            _logsi = Test_SISession._CreateSISession(connectionstring)
+            cls._Sessions[connectionstring] = _logsi
+
+        if (sessionName == _logsi.Name):
+            return _logsi
+
+        # add a new session to the shared SmartInspect object if needed.
+        _logsiTest:SISession = _logsi.Parent.GetSession(sessionName)
+        if (_logsiTest == None):
+            _logsiTest = _logsi.Parent.AddSession(sessionName, True)
+            _logsiTest.Level = SILevel.Debug
+        return _logsiTest
+
+
     @staticmethod
     def _CreateSISession(connectionstring:str) -> SISession:
         """
@@ -62,7 +106,7 @@ class Test_SISession(unittest.TestCase):
         try:
 
             # create a new smartinspect session for logging.
-            _logsi:SISession = Test_SISession._CreateSISession(CONNECTION_FILE_HOURLY24)
+            _logsi:SISession = Test_SISession._GetSISession(CONNECTION_FILE_HOURLY24, self._testMethodName)
 
             # perform tests.
             _logsi.LogSeparator()
@@ -83,15 +127,15 @@ class Test_SISession(unittest.TestCase):
         Test colored message scenarios.
         """
         # create a new smartinspect session for logging.
-        #_logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+        _logsi:SISession = Test_SISession._GetSISession(CONNECTION_TCP, self._testMethodName)
 
         try:
 
             _logsi.EnterMethod(SILevel.Debug)
        
             # log message in all known color values.
-            for s in SIColors:
-                _logsi.LogMessage("This is a message in color '{0}'.".format(s.name), s.value)
+            for title, value in _COLORS:
+                _logsi.LogMessage(title, colorValue=value)
 
         except Exception as ex:
 
@@ -111,7 +155,7 @@ class Test_SISession(unittest.TestCase):
         try:
 
             # create a new smartinspect session for logging.
-            _logsi: SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+            _logsi: SISession = Test_SISession._GetSISession(CONNECTION_TCP, self._testMethodName)
        
             # perform tests.
             _logsi.Watch(None,"string_cs", "string1 value")
@@ -134,7 +178,7 @@ class Test_SISession(unittest.TestCase):
         try:
 
             # create a new smartinspect session for logging.
-            _logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+            _logsi:SISession = Test_SISession._GetSISession(CONNECTION_TCP, self._testMethodName)
 
             # perform tests.
             _logsi.ClearWatches()
@@ -152,7 +196,7 @@ class Test_SISession(unittest.TestCase):
         try:
 
             # create a new smartinspect session for logging.
-            _logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+            _logsi:SISession = Test_SISession._GetSISession(CONNECTION_TCP, self._testMethodName)
 
             # perform tests.
             _logsi.ClearProcessFlow()
@@ -170,7 +214,7 @@ class Test_SISession(unittest.TestCase):
         try:
 
             # create a new smartinspect session for logging.
-            _logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+            _logsi:SISession = Test_SISession._GetSISession(CONNECTION_TCP, self._testMethodName)
 
             # perform tests.
             _logsi.ClearLog()
@@ -188,7 +232,7 @@ class Test_SISession(unittest.TestCase):
         try:
 
             # create a new smartinspect session for logging.
-            _logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+            _logsi:SISession = Test_SISession._GetSISession(CONNECTION_TCP, self._testMethodName)
 
             # perform tests.
             _logsi.ClearAll()
@@ -206,7 +250,7 @@ class Test_SISession(unittest.TestCase):
         try:
 
             # create a new smartinspect session for logging.
-            _logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+            _logsi:SISession = Test_SISession._GetSISession(CONNECTION_TCP, self._testMethodName)
 
             # perform tests.
             _logsi.ClearAutoViews()
@@ -224,7 +268,7 @@ class Test_SISession(unittest.TestCase):
         try:
 
             # create a new smartinspect session for logging.
-            _logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+            _logsi:SISession = Test_SISession._GetSISession(CONNECTION_TCP, self._testMethodName)
 
             inspect.getmembers(_logsi)
 
@@ -238,7 +282,7 @@ class Test_SISession(unittest.TestCase):
 
 
 # create a new smartinspect session for logging.
-_logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
+_logsi:SISession = Test_SISession._GetSISession(CONNECTION_TCP)
 
 if __name__ == '__main__':
     #_logsi:SISession = Test_SISession._CreateSISession(CONNECTION_TCP)
@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 import os
 import time
@@ -24,29 +25,42 @@ print("Loading SmartInspect settings from configuration settings file:\n{0}\n".f
 SIAuto.Si.LoadConfiguration(configPath)
 
 # start monitoring the configuration file for changes, and reload it when it changes.
-# this will check the file for changes every 5 seconds.
+# changes are detected via file system events (or polled if watchdog is not installed).
 config:SIConfigurationTimer = SIConfigurationTimer(SIAuto.Si, configPath)
 print("Monitoring SmartInspect configuration settings for changes.")
 
 # get smartinspect logger reference.
 _logsi:SISession = SIAuto.Main
 SIAuto.Si.AddSession('NewSession1', True)
+_logsi1:SISession = SIAuto.Si.GetSession("NewSession1")
+
+# bind the logging methods once, so they are not resolved on every iteration.
+_logDebug = _logsi.LogDebug
+_logVerbose = _logsi.LogVerbose
+_logMessage = _logsi.LogMessage
+_logWarning = _logsi.LogWarning
+_logError = _logsi.LogError
+_logFatal = _logsi.LogFatal
+_logMessage1 = _logsi1.LogMessage if (_logsi1 != None) else None
 
 # keep logging messages every second for 300 seconds.
 # while it is running, change the configuration file "level" value
 # and watch the Si Console to see if changes were applied.
 for i in range(300):
     time.sleep(1)
-    _logsi.LogDebug("This is a test Debug message (current Level=\"{0}\").".format(str(_logsi.Parent.Level)))
-    _logsi.LogVerbose("This is a test Verbose message (current Level=\"{0}\").".format(str(_logsi.Parent.Level)))
-    _logsi.LogMessage("This is a test Message message (current Level=\"{0}\").".format(str(_logsi.Parent.Level)))
-    _logsi.LogWarning("This is a test Warning message (current Level=\"{0}\").".format(str(_logsi.Parent.Level)))
-    _logsi.LogError("This is a test Error message (current Level=\"{0}\").".format(str(_logsi.Parent.Level)))
-    _logsi.LogFatal("This is a test Fatal message (current Level=\"{0}\").".format(str(_logsi.Parent.Level)))
-
-    _logsi1:SISession = SIAuto.Si.GetSession("NewSession1")
-    if (_logsi1 != None):
-        _logsi1.LogMessage("_logsi1 - This is a test Message message (current Level=\"{0}\").".format(str(_logsi1.Parent.Level)))
+
+    # the level can change between iterations (when the configuration is reloaded),
+    # so it is only formatted once per iteration.
+    levelName:str = str(_logsi.Parent.Level)
+    _logDebug("This is a test Debug message (current Level=\"{0}\").".format(levelName))
+    _logVerbose("This is a test Verbose message (current Level=\"{0}\").".format(levelName))
+    _logMessage("This is a test Message message (current Level=\"{0}\").".format(levelName))
+    _logWarning("This is a test Warning message (current Level=\"{0}\").".format(levelName))
+    _logError("This is a test Error message (current Level=\"{0}\").".format(levelName))
+    _logFatal("This is a test Fatal message (current Level=\"{0}\").".format(levelName))
+
+    if (_logMessage1 != None):
+        _logMessage1("_logsi1 - This is a test Message message (current Level=\"{0}\").".format(str(_logsi1.Parent.Level)))
 
 value:str = ""
 
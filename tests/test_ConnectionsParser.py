@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 # our package imports.
 from smartinspectpython.siconnectionsparser import SIConnectionsParser
@@ -0,0 +1,87 @@
+# add project drectory to python search paths for relative references
+import sys
+if ("." not in sys.path):
+    sys.path.append(".")
+
+import os
+import unittest
+from io import BytesIO
+
+from Crypto.Cipher import AES
+
+# our package imports.
+from smartinspectpython.sicryptostreamwriter import SICryptoStreamWriter
+from smartinspectpython.smartinspect import SmartInspect
+from smartinspectpython.sisession import SISession
+
+# log file used by the tests.
+LOG_FILE_PATH:str = "./tests/logfiles/FileProtocol-ENCRYPTFLUSHTEST.sil"
+
+class Test_CryptoStreamWriter(unittest.TestCase):
+    """
+    Test SICryptoStreamWriter scenarios.
+    """
+
+    def test_EncryptedFileFlushedPerPacket(self):
+        """
+        Test that an encrypted log file (flushonwrite=true, the default) is written
+        to disk for every packet, instead of only when the protocol disconnects.
+        """
+        si:SmartInspect = SmartInspect(__name__ + ".py")
+        errors:list = []
+        si.ErrorEvent += lambda sender, e: errors.append(str(e.Exception))
+
+        try:
+
+            si.Connections = "file(filename=\"{0}\", encrypt=true, key=\"secret\", append=false)".format(LOG_FILE_PATH)
+            si.Enabled = True
+            _logsi:SISession = si.AddSession("Main", True)
+
+            # each packet must grow the file; the size after connecting only
+            # contains the header (and the log header packet, if any).
+            lastSize:int = os.path.getsize(LOG_FILE_PATH)
+            for i in range(10):
+                _logsi.LogMessage("Encrypted message {0}".format(i))
+                size:int = os.path.getsize(LOG_FILE_PATH)
+                self.assertGreater(size, lastSize, "encrypted log file did not grow after packet {0}".format(i))
+                lastSize = size
+
+            self.assertEqual(errors, [])
+
+        finally:
+
+            si.Dispose()
+
+
+    def test_NewAesCtrRoundTrip(self):
+        """
+        Test that data encrypted by a CTR mode writer (NewAesCtr) decrypts back to
+        the original data, and that no padding is added.
+        """
+        key:bytes = bytes(range(16))
+        nonce:bytes = bytes(range(8))
+        plain:bytes = bytes(i % 251 for i in range(100000))
+
+        stream:BytesIO = BytesIO()
+        writer:SICryptoStreamWriter = SICryptoStreamWriter.NewAesCtr(stream, key, nonce)
+
+        # write the data in uneven chunks, so that writes do not line up with blocks.
+        offset:int = 0
+        chunkSize:int = 1
+        while (offset < len(plain)):
+            writer.write(plain[offset:offset + chunkSize])
+            offset = offset + chunkSize
+            chunkSize = (chunkSize * 7) % 5003 + 1
+
+        # get the data before closing, as closing the writer closes the stream.
+        writer.flush()
+        encrypted:bytes = stream.getvalue()
+        writer.close()
+
+        self.assertEqual(len(encrypted), len(plain))
+        self.assertNotEqual(encrypted, plain)
+        self.assertEqual(AES.new(key, AES.MODE_CTR, nonce=nonce).decrypt(encrypted), plain)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 import sqlite3
 
@@ -24,7 +25,20 @@ SIAuto.Si.Enabled = True
 _logsi:SISession = SIAuto.Main
 
 # connect to the database.
-conn = sqlite3.connect("./tests/testdata/TestDBSqlite.db")
+# transactions are managed explicitly (isolation_level=None), so that all of the
+# queries below run in a single read transaction instead of one per statement.
+conn = sqlite3.connect("./tests/testdata/TestDBSqlite.db", isolation_level=None)
+
+# tune the connection for the read-only queries below: use a larger page cache,
+# keep temporary tables / sort results in memory, and disallow writes.
+# note that WAL journal mode is not used, as it is persisted in the database file.
+conn.execute("PRAGMA cache_size=-65536;")
+conn.execute("PRAGMA temp_store=MEMORY;")
+conn.execute("PRAGMA query_only=ON;")
+
+# start a deferred transaction; the database file is locked and its schema
+# is loaded once, rather than for each query.
+conn.execute("BEGIN;")
 
 ## execute a query, returning a cursor.
 #cursor = conn.execute("SELECT * FROM sqlite_master WHERE type='table' ORDER BY name;")
@@ -58,12 +72,15 @@ _logsi.LogSqliteDbSchemaTableInfo(None, conn=conn, tableName="employees")
 _logsi.LogSqliteDbSchemaTableInfo(None, "LogSqliteDBTableSchema sorted by Column ID", conn, "employees")
 _logsi.LogSqliteDbSchemaTableInfo(None, "LogSqliteDBTableSchema sorted by Column Name", conn, "employees", True)
 
+_logsi.LogSqliteDbSchemaSummary(None, conn=conn)
+
 _logsi.LogObject(None,"Cursor Object", cursor)
 _logsi.LogSqliteDbSchemaCursor(None, None, cursor)
 _logsi.LogSqliteDbSchemaCursor(None, "LogSqliteCursorSchema Title", cursor)
 _logsi.LogSqliteDbSchemaCursor(None, "LogSqliteCursorSchema Title (empty cursor)", None)
 
-# close db connection.
+# end the read transaction, and close db connection.
+conn.execute("COMMIT;")
 conn.close()
 
 # print SI event counts, unwire events, and dispose of SmartInspect.
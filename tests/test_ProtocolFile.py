@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 # our package imports.
 from smartinspectpython.siauto import *
@@ -9,6 +10,9 @@ from smartinspectpython.siauto import *
 from testClassDefinitions import SIEventHandlerClass
 from testSessionMethods import TestSessionMethods
 
+# connections string used by the test (file protocol, encrypted).
+CONNECTION_FILE:str = "file(filename=\"./tests/logfiles/FileProtocol-RotateHourlyEncrypted.sil\", encrypt=true, key=\"1234567890123456\", rotate=hourly, maxparts=14, append=true)"
+
 print("Test Script Starting.\n")
 
 # wire up smartinspect events.
@@ -19,7 +23,7 @@ SIEventHandlerClass.WireEvents(SIAuto.Si)
 #SIAuto.Si.Connections = "file(filename=\"./tests/logfiles/FileProtocol-RotateHourlyAppendYes.sil\", rotate=hourly, maxparts=24, append=true)"
 #SIAuto.Si.Connections = "file(filename=\"./tests/logfiles/FileProtocol-RotateHourlyBuffer.sil\", rotate=hourly, maxparts=24, append=true, buffer=1024kb)"
 #SIAuto.Si.Connections = "file(filename=\"./tests/logfiles/FileProtocol-RotateHourly.sil\", rotate=hourly, maxparts=24, append=true)"
-SIAuto.Si.Connections = "file(filename=\"./tests/logfiles/FileProtocol-RotateHourlyEncrypted.sil\", encrypt=true, key=""1234567890123456"", rotate=hourly, maxparts=14, append=true)"
+SIAuto.Si.Connections = CONNECTION_FILE
 SIAuto.Si.Enabled = True
 
 # get smartinspect logger reference.
@@ -36,13 +40,7 @@ _logsi.Level = SILevel.Debug
 TestSessionMethods.TestAllMethods(_logsi)
 
 # log counters to SI console.
-_logsi.Watch(SILevel.Fatal, "Total Packets LogEntry", SIEventHandlerClass.LogEntryCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets ProcessFlow", SIEventHandlerClass.ProcessFlowCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets ControlCmd", SIEventHandlerClass.ControlCommandCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets Watch", SIEventHandlerClass.WatchCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets Filtered", SIEventHandlerClass.FilterCount)
-_logsi.Watch(SILevel.Fatal, "Total Error", SIEventHandlerClass.ErrorCount)
-_logsi.Watch(SILevel.Fatal, "Total Info", SIEventHandlerClass.InfoCount)
+SIEventHandlerClass.WatchCounters(_logsi)
 
 # print SI event counts, unwire events, and dispose of SmartInspect.
 SIEventHandlerClass.PrintResults(SIAuto.Si)
@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 # our package imports.
 from smartinspectpython.siauto import *
@@ -34,35 +35,31 @@ _logsi.Level = SILevel.Debug
 TestSessionMethods.TestAllMethods(_logsi)
 
 # log counters to SI console.
-_logsi.Watch(SILevel.Fatal, "Total Packets LogEntry", SIEventHandlerClass.LogEntryCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets ProcessFlow", SIEventHandlerClass.ProcessFlowCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets ControlCmd", SIEventHandlerClass.ControlCommandCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets Watch", SIEventHandlerClass.WatchCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets Filtered", SIEventHandlerClass.FilterCount)
-_logsi.Watch(SILevel.Fatal, "Total Error", SIEventHandlerClass.ErrorCount)
-_logsi.Watch(SILevel.Fatal, "Total Info", SIEventHandlerClass.InfoCount)
+SIEventHandlerClass.WatchCounters(_logsi)
 
 # logging done - write memory stream to output file.
-try:
+# set file path based on the protocol "astext" option.
+asText:bool = ("astext=true" in SIAuto.Si.Connections)
+if (asText):
+    filePath:str = "./tests/logfiles/MemProtocol-AsTextTrue.txt"
+else:
+    filePath:str = "./tests/logfiles/MemProtocol-AsTextFalse.sil"
 
-    # set file path and open flags.
-    if (SIAuto.Si.Connections.find("astext=true") != -1):
-        filePath:str = "./tests/logfiles/MemProtocol-AsTextTrue.txt"
-    else:
-        filePath:str = "./tests/logfiles/MemProtocol-AsTextFalse.sil"
+try:
 
-    # open the log file.
+    # open the log file; a large write buffer is used so that the log data is
+    # written to the file in a few large writes.
     fileFlags:str = 'wb'    # 'wb' is write as binary; use 'ab' to append to existing file if desired.
-    stream = open(filePath, fileFlags)
+    with open(filePath, fileFlags, buffering=0x100000) as stream:
 
-    # inform the memory protocol to write log data in memory to our log file.
-    SIAuto.Si.Dispatch("mem", 0, stream)
+        # inform the memory protocol to write log data in memory to our log file.
+        SIAuto.Si.Dispatch("mem", 0, stream)
 
     print("In-Memory log was written to log file: " + filePath)
 
 except Exception as ex:
 
-    print(str.format("Could not save log data to file.  Ensure it is a valid file name, and that it is not open in another application.  Log file path: \"{0}\".\nException message:{1}", fileName, str(ex)))
+    print("Could not save log data to file.  Ensure it is a valid file name, and that it is not open in another application.  Log file path: \"{0}\".\nException message:{1}".format(filePath, str(ex)))
 
 # print SI event counts, unwire events, and dispose of SmartInspect.
 SIEventHandlerClass.PrintResults(SIAuto.Si)
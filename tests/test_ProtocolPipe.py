@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 # our package imports.
 from smartinspectpython.siauto import *
@@ -32,13 +33,7 @@ _logsi.Level = SILevel.Debug
 TestSessionMethods.TestAllMethods(_logsi)
 
 # log counters to SI console.
-_logsi.Watch(SILevel.Fatal, "Total Packets LogEntry", SIEventHandlerClass.LogEntryCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets ProcessFlow", SIEventHandlerClass.ProcessFlowCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets ControlCmd", SIEventHandlerClass.ControlCommandCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets Watch", SIEventHandlerClass.WatchCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets Filtered", SIEventHandlerClass.FilterCount)
-_logsi.Watch(SILevel.Fatal, "Total Error", SIEventHandlerClass.ErrorCount)
-_logsi.Watch(SILevel.Fatal, "Total Info", SIEventHandlerClass.InfoCount)
+SIEventHandlerClass.WatchCounters(_logsi)
 
 # print SI event counts, unwire events, and dispose of SmartInspect.
 SIEventHandlerClass.PrintResults(SIAuto.Si)
@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 # our package imports.
 from smartinspectpython.siauto import *
@@ -19,8 +20,8 @@ print("Test Script Starting.")
 SIEventHandlerClass.WireEvents(SIAuto.Si)
 
 # set smartinspect connections, and enable logging.
-#SIAuto.Si.Connections = "tcp(host=win10vm.netlucas.com,port=4228,timeout=30000,reconnect=true,reconnect.interval=10s,async.enabled=false)"  # Test Async Mode
-SIAuto.Si.Connections = "tcp(host=192.168.1.1,port=4228,timeout=30000,reconnect=true,reconnect.interval=10s,async.enabled=false)"  # Test Async Mode
+#SIAuto.Si.Connections = "tcp(host=win10vm.netlucas.com,port=4228,timeout=30000,nodelay=true,reconnect=true,reconnect.interval=10s,async.enabled=false)"  # Test Async Mode
+SIAuto.Si.Connections = "tcp(host=192.168.1.1,port=4228,timeout=30000,nodelay=true,reconnect=true,reconnect.interval=10s,async.enabled=false)"  # Test Async Mode
 SIAuto.Si.Enabled = True
 
 # get smartinspect logger reference.
@@ -48,13 +49,7 @@ for level in SILevel:
     TestSessionMethods.TestAllMethods(_logsi)
 
     # log counters to SI console.
-    _logsi.Watch(SILevel.Fatal, "Total Packets LogEntry", SIEventHandlerClass.LogEntryCount)
-    _logsi.Watch(SILevel.Fatal, "Total Packets ProcessFlow", SIEventHandlerClass.ProcessFlowCount)
-    _logsi.Watch(SILevel.Fatal, "Total Packets ControlCmd", SIEventHandlerClass.ControlCommandCount)
-    _logsi.Watch(SILevel.Fatal, "Total Packets Watch", SIEventHandlerClass.WatchCount)
-    _logsi.Watch(SILevel.Fatal, "Total Packets Filtered", SIEventHandlerClass.FilterCount)
-    _logsi.Watch(SILevel.Fatal, "Total Error", SIEventHandlerClass.ErrorCount)
-    _logsi.Watch(SILevel.Fatal, "Total Info", SIEventHandlerClass.InfoCount)
+    SIEventHandlerClass.WatchCounters(_logsi)
 
     # print SI event counts.
     SIEventHandlerClass.PrintResults(_logsi.Parent)
@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 # our package imports.
 from smartinspectpython.siauto import *
@@ -37,13 +38,14 @@ _logsi.Level = SILevel.Debug
 TestSessionMethods.TestAllMethods(_logsi)
 
 # log counters to SI console.
-_logsi.Watch(SILevel.Fatal, "Total Packets LogEntry", SIEventHandlerClass.LogEntryCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets ProcessFlow", SIEventHandlerClass.ProcessFlowCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets ControlCmd", SIEventHandlerClass.ControlCommandCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets Watch", SIEventHandlerClass.WatchCount)
-_logsi.Watch(SILevel.Fatal, "Total Packets Filtered", SIEventHandlerClass.FilterCount)
-_logsi.Watch(SILevel.Fatal, "Total Error", SIEventHandlerClass.ErrorCount)
-_logsi.Watch(SILevel.Fatal, "Total Info", SIEventHandlerClass.InfoCount)
+counters:dict = SIEventHandlerClass.GetCounters(SIAuto.Si)
+_logsi.Watch(SILevel.Fatal, "Total Packets LogEntry", counters["LogEntryCount"])
+_logsi.Watch(SILevel.Fatal, "Total Packets ProcessFlow", counters["ProcessFlowCount"])
+_logsi.Watch(SILevel.Fatal, "Total Packets ControlCmd", counters["ControlCommandCount"])
+_logsi.Watch(SILevel.Fatal, "Total Packets Watch", counters["WatchCount"])
+_logsi.Watch(SILevel.Fatal, "Total Packets Filtered", counters["FilterCount"])
+_logsi.Watch(SILevel.Fatal, "Total Error", counters["ErrorCount"])
+_logsi.Watch(SILevel.Fatal, "Total Info", counters["InfoCount"])
 
 # print SI event counts, unwire events, and dispose of SmartInspect.
 SIEventHandlerClass.PrintResults(SIAuto.Si)
@@ -1,14 +1,17 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 
 # external package imports.
 import logging
 import logging.handlers
 import os
+from concurrent.futures import ThreadPoolExecutor
 
 # our package imports.
 from smartinspectpython.siauto import *
+from smartinspectpython.smartinspect import SmartInspect
 
 # import classes used for test scenarios.
 from testClassDefinitions import SIEventHandlerClass
@@ -21,63 +24,120 @@ logfilePath:str = exedir + "/logfiles/"
 argsVar1:str="Argument 1 Value"
 argsVar2:int=1000
 
-# wire up smartinspect events.
-SIEventHandlerClass.WireEvents(SIAuto.Si)
+# system logging level names for each smartinspect logging level, keyed by 
+# SILevel value (SILevel members are not hashable).
+# NOTSET=0, DEBUG=10, INFO=20, WARN=30, ERROR=40, CRITICAL=50
+_SYSLOG_LEVELS:dict = {
+    SILevel.Debug.value: "DEBUG",
+    SILevel.Verbose.value: "DEBUG",
+    SILevel.Message.value: "INFO",
+    SILevel.Warning.value: "WARN",
+    SILevel.Error.value: "ERROR",
+    SILevel.Fatal.value: "CRITICAL",
+}
 
-# set smartinspect connections, and enable logging.
-SIAuto.Si.Connections = "tcp(host=localhost,port=4228,timeout=30000)"
-SIAuto.Si.Enabled = True
+# smartinspect connections used by each level test.
+CONNECTION_TCP:str = "tcp(host=localhost,port=4228,timeout=30000)"
 
-# get smartinspect logger reference.
-_logsi:SISession = SIAuto.Main
+# system logging formatter, shared by all level tests.
+formatter = logging.Formatter(logging.BASIC_FORMAT)
 
-for level in SILevel:
 
-    if (level == SILevel.Control):
-        continue
+def RunLevelTest(level:SILevel) -> SISession:
+    """
+    Tests all session methods for the specified logging level.
+
+    Each level is tested with its own SmartInspect instance, system logger
+    and log file, so that the level tests can run in parallel.
+
+    Returns:
+        The SmartInspect session that was used for the test.
+    """
+    # create a smartinspect instance for this level, and wire up events.
+    si:SmartInspect = SmartInspect("test_SystemLogger.py")
+    SIEventHandlerClass.WireEvents(si)
+
+    # set smartinspect connections, and enable logging.
+    si.Connections = CONNECTION_TCP
+    si.Enabled = True
+    _logsi:SISession = si.AddSession("Main", True)
 
     # reset counters for next test.
-    SIEventHandlerClass.ResetCounters(_logsi.Parent)
-    
-    # get system logging level based on smartinspect logging level.
-    # NOTSET=0, DEBUG=10, INFO=20, WARN=30, ERROR=40, CRITICAL=50
-    sysLoglevel:str = level.name.upper()
-    if level == SILevel.Fatal:
-        sysLoglevel = "CRITICAL"
-    elif level == SILevel.Message:
-        sysLoglevel = "INFO"
-    elif level == SILevel.Verbose:
-        sysLoglevel = "DEBUG"
-    elif level == SILevel.Warning:
-        sysLoglevel = "WARN"
-
-    # configure system logging (to file).
+    SIEventHandlerClass.ResetCounters(si)
+
+    # configure system logging (to a file for this level).
+    # messages are not propagated to the root logger, since each level
+    # writes to its own log file.
     handler = logging.handlers.WatchedFileHandler(logfilePath+"test_SystemLogger_Output_{0}.log".format(level.name))
-    formatter = logging.Formatter(logging.BASIC_FORMAT)
     handler.setFormatter(formatter)
-    _LOGGER = logging.getLogger()
-    _LOGGER.setLevel(sysLoglevel)
+    _LOGGER = logging.getLogger("test_SystemLogger.{0}".format(level.name))
+    _LOGGER.propagate = False
+    _LOGGER.setLevel(_SYSLOG_LEVELS[level.value])
     _LOGGER.addHandler(handler)
 
     # add system logging to smartinspect logger.
     _logsi.SystemLogger = _LOGGER
 
-    # test all session methods, using specified logging level.
-    # note that we will just change the Parent.Level value for this.
-    # the Parent.Default and SISession.Level are set to Debug, in the
-    # event that configuration file contains other values.  this
-    # makes for a 1-to-1 comparison between level test runs.
-    _logsi.Parent.Level = level
-    _logsi.Parent.DefaultLevel = SILevel.Debug
-    _logsi.Level = SILevel.Debug
-    TestSessionMethods.TestAllMethods(_logsi)
-
-    # print SI event counts.
-    SIEventHandlerClass.PrintResults(_logsi.Parent)
-
-    print("Test was Successful!")
-
-# print SI event counts, unwire events, and dispose of SmartInspect.
-SIEventHandlerClass.PrintResults(SIAuto.Si)
-SIEventHandlerClass.UnWireEvents(SIAuto.Si)
-SIAuto.Si.Dispose()
+    try:
+
+        # test all session methods, using specified logging level.
+        # note that we will just change the Parent.Level value for this.
+        # the Parent.Default and SISession.Level are set to Debug, in the
+        # event that configuration file contains other values.  this
+        # makes for a 1-to-1 comparison between level test runs.
+        _logsi.Parent.Level = level
+        _logsi.Parent.DefaultLevel = SILevel.Debug
+        _logsi.Level = SILevel.Debug
+        TestSessionMethods.TestAllMethods(_logsi)
+
+    except:
+
+        # unwire events and dispose of SmartInspect if the test failed, as the
+        # caller never receives the session to do it.
+        SIEventHandlerClass.UnWireEvents(si)
+        si.Dispose()
+        raise
+
+    finally:
+
+        # close the system logging file handler.
+        _LOGGER.removeHandler(handler)
+        handler.close()
+
+    return _logsi
+
+
+# run the level tests in parallel; results are reported in level order.
+levels:list = [level for level in SILevel if (level != SILevel.Control)]
+failures:list = []
+with ThreadPoolExecutor(max_workers=4) as executor:
+
+    futures:list = [(level, executor.submit(RunLevelTest, level)) for level in levels]
+
+    for level, future in futures:
+
+        # a failed level test has already disposed of its SmartInspect instance;
+        # keep going so that the instances of the other levels are disposed too.
+        try:
+            _logsi:SISession = future.result()
+        except Exception as ex:
+            print("Test FAILED for Level \"{0}\": {1}".format(str(level.name), str(ex)))
+            failures.append(ex)
+            continue
+
+        try:
+
+            # print SI event counts.
+            SIEventHandlerClass.PrintResults(_logsi.Parent)
+
+        finally:
+
+            # unwire events, and dispose of SmartInspect.
+            SIEventHandlerClass.UnWireEvents(_logsi.Parent)
+            _logsi.Parent.Dispose()
+
+        print("Test was Successful!")
+
+# report the first failure (if any) once all instances have been disposed.
+if (len(failures) > 0):
+    raise failures[0]
@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append("..")
+if (".." not in sys.path):
+    sys.path.append("..")
 #sys.path.append(".")
 
 # our package imports.
@@ -16,9 +17,10 @@ tc.AppendLine("This is an Appended Line with no LF or CR at the end.")
 tc.AppendLine("This is an Appended Line with LF at the end.\n")
 tc.AppendLine("This is an Appended Line with CRLF at the end.\r\n")
 tc.AppendText("This is Appended Text line 1.\nThis is Appended Text line 2.\n")
-print("SITextContext Data:\n" + str(tc.ViewerData))
 
+# ViewerData builds a new stream from the text each time it is referenced, 
+# so it is only referenced once.
 data = tc.ViewerData.read()
-print("data=" + str(data))
+print("SITextContext Data:\n" + str(data))
 
 print("\nTest Script Ended.")
@@ -1,6 +1,7 @@
 # add project drectory to python search paths for relative references
 import sys
-sys.path.append(".")
+if ("." not in sys.path):
+    sys.path.append(".")
 sys.path.append("C:\\Users\\thluc\\AppData\\Roaming\\Python\\Python39\\site-packages")
 
 import pdoc
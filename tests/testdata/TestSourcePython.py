@@ -3,8 +3,8 @@ from inspect import getsourcefile
 python_path = os.environ['PYTHONPATH'].split(os.pathsep)
 current_working_dir = os.getcwd()
 current_absolute_source = path.abspath(getsourcefile(lambda:0))
-current_absolute_dir = path.dirname(path.abspath(getsourcefile(lambda:0)))
-current_absolute_dir_parent = current_absolute_dir[:current_absolute_dir.rfind(path.sep)]
+current_absolute_dir = path.dirname(current_absolute_source)
+current_absolute_dir_parent = path.dirname(current_absolute_dir)
 print("Environment Setup (test_configuration_in_src.py):")
 print("- PYTHONPATH:      " + os.environ['PYTHONPATH'])
 print("- CURRENT_WRK_DIR: " + os.getcwd())